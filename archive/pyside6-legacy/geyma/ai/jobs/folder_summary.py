@@ -5,7 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 import os
 import time
-from typing import Any
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from geyma.ai.provider_registry import create_provider
 from geyma.utils.config import ConfigStore
@@ -21,7 +23,36 @@ class FolderStats:
     age_buckets: dict[str, int]
 
 
-def analyze_folder(root: str, include_hidden: bool = False) -> FolderStats:
+class FolderSummarySignals(QObject):
+    finished = Signal(object)
+    canceled = Signal()
+
+
+class FolderSummaryWorker(QRunnable):
+    def __init__(self, root: str, include_hidden: bool, should_cancel: Callable[[], bool]) -> None:
+        super().__init__()
+        self._root = root
+        self._include_hidden = include_hidden
+        self._should_cancel = should_cancel
+        self.signals = FolderSummarySignals()
+
+    def run(self) -> None:
+        stats = analyze_folder(
+            self._root,
+            include_hidden=self._include_hidden,
+            should_cancel=self._should_cancel,
+        )
+        if self._should_cancel():
+            self.signals.canceled.emit()
+            return
+        self.signals.finished.emit(stats)
+
+
+def analyze_folder(
+    root: str,
+    include_hidden: bool = False,
+    should_cancel: Callable[[], bool] | None = None,
+) -> FolderStats:
     base = Path(root)
     total_files = 0
     total_dirs = 0
@@ -32,6 +63,8 @@ def analyze_folder(root: str, include_hidden: bool = False) -> FolderStats:
     now = time.time()
 
     for dirpath, dirnames, filenames in os.walk(base):
+        if should_cancel is not None and should_cancel():
+            break
         if not include_hidden:
             dirnames[:] = [d for d in dirnames if not d.startswith(".")]
             filenames = [f for f in filenames if not f.startswith(".")]
@@ -58,8 +91,14 @@ def analyze_folder(root: str, include_hidden: bool = False) -> FolderStats:
     )
 
 
-def summarize_folder(root: str, include_hidden: bool = False, allow_ai: bool = False) -> dict[str, Any]:
-    stats = analyze_folder(root, include_hidden=include_hidden)
+def summarize_folder(
+    root: str,
+    include_hidden: bool = False,
+    allow_ai: bool = False,
+    stats: FolderStats | None = None,
+) -> dict[str, Any]:
+    if stats is None:
+        stats = analyze_folder(root, include_hidden=include_hidden)
     result: dict[str, Any] = {"stats": stats.__dict__, "source": "local", "text": "", "error": ""}
 
     config = ConfigStore()
@@ -4,6 +4,7 @@ from base64 import b64encode
 from pathlib import Path
 import mimetypes
 import os
+from stat import S_ISDIR
 from typing import Any
 
 from geyma.ai.provider_registry import create_provider
@@ -14,8 +15,7 @@ def collect_items(paths: list[str]) -> list[dict]:
     items: list[dict] = []
     for raw_path in paths:
         path = Path(raw_path)
-        if not path.exists():
-            continue
+        # A single stat covers the existence, size, mtime and type checks.
         try:
             stat = path.stat()
         except OSError:
@@ -28,7 +28,7 @@ def collect_items(paths: list[str]) -> list[dict]:
                 "mime": mimetypes.guess_type(str(path))[0] or "",
                 "size": stat.st_size,
                 "mtime": int(stat.st_mtime),
-                "is_dir": path.is_dir(),
+                "is_dir": S_ISDIR(stat.st_mode),
             }
         )
     return items
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from geyma.ai.filters import parse_nl_query
@@ -7,20 +8,27 @@ from geyma.ai.provider_registry import create_provider
 from geyma.utils.config import ConfigStore
 
 
+@lru_cache(maxsize=128)
+def _parse_local(query: str) -> dict[str, Any]:
+    return parse_nl_query(query)
+
+
 def translate_query(query: str, allow_ai: bool = False) -> dict[str, Any]:
     """Return structured filters from a query, using AI if enabled."""
-    local = parse_nl_query(query)
+    local = _parse_local(query)
     result: dict[str, Any] = {
         "query": local.get("query", ""),
-        "filters": local.get("filters", []),
-        "notes": local.get("notes", []),
+        "filters": [dict(spec) for spec in local.get("filters", [])],
+        "notes": list(local.get("notes", [])),
         "source": "local",
         "ai": None,
         "error": "",
     }
 
+    if not allow_ai:
+        return result
     config = ConfigStore()
-    if not allow_ai or not config.get_bool("ai_enabled", False):
+    if not config.get_bool("ai_enabled", False):
         return result
 
     provider_name = config.get_str("ai_provider", "none")
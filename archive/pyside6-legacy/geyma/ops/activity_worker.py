@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from geyma.utils.operation_log import OperationLog, parse_timestamp
+
+
+class ActivitySignals(QObject):
+    finished = Signal(int, list, bool)
+
+
+@dataclass
+class ActivityFilterPlan:
+    action_filter: str
+    name_filter: str
+    cutoff: datetime | None
+    anchors: frozenset[str]
+    limit: int
+
+
+class ActivityFilterWorker(QRunnable):
+    def __init__(
+        self,
+        op_log: OperationLog,
+        request_id: int,
+        action_filter: str,
+        name_filter: str,
+        cutoff: datetime | None,
+        anchors: frozenset[str],
+        limit: int,
+    ) -> None:
+        super().__init__()
+        self.signals = ActivitySignals()
+        self._op_log = op_log
+        self._request_id = request_id
+        self._plan = ActivityFilterPlan(
+            action_filter=action_filter,
+            name_filter=name_filter,
+            cutoff=cutoff,
+            anchors=anchors,
+            limit=limit,
+        )
+        self._cancel = False
+
+    def cancel(self) -> None:
+        self._cancel = True
+
+    def run(self) -> None:
+        plan = self._plan
+        visible: list[dict] = []
+        capped = False
+        for entry in self._op_log.iter_entries_reversed():
+            if self._cancel:
+                return
+            if plan.cutoff:
+                timestamp = parse_timestamp(str(entry.get("timestamp", "")))
+                if timestamp is None:
+                    continue
+                if timestamp < plan.cutoff:
+                    break
+            if plan.anchors and not entry_matches_working_set(entry, plan.anchors):
+                continue
+            action = str(entry.get("action", "")).lower()
+            if plan.action_filter and plan.action_filter != "all" and action != plan.action_filter:
+                continue
+            if plan.name_filter and not entry_matches_name(entry, plan.name_filter):
+                continue
+            if len(visible) >= plan.limit:
+                capped = True
+                break
+            visible.append(entry)
+        self.signals.finished.emit(self._request_id, visible, capped)
+
+
+def working_set_anchors(paths: list[str]) -> frozenset[str]:
+    return frozenset(os.path.normpath(path) for path in paths if path)
+
+
+def entry_paths(entry: dict) -> list[str]:
+    paths = entry.get("_paths_norm")
+    if paths is None:
+        paths = [
+            os.path.normpath(path)
+            for path in entry.get("sources", []) + entry.get("destinations", [])
+            if path
+        ]
+        entry["_paths_norm"] = paths
+    return paths
+
+
+def entry_matches_working_set(entry: dict, anchors: frozenset[str]) -> bool:
+    # Walk each entry path up through its parents; a hit on any anchor
+    # means the entry lies inside the working set.
+    if not anchors:
+        return False
+    for current in entry_paths(entry):
+        while True:
+            if current in anchors:
+                return True
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+    return False
+
+
+def entry_names(entry: dict) -> list[str]:
+    names = entry.get("_names_lower")
+    if names is None:
+        names = [os.path.basename(path).lower() for path in entry_paths(entry)]
+        entry["_names_lower"] = names
+    return names
+
+
+def entry_matches_name(entry: dict, fragment: str) -> bool:
+    names = entry_names(entry)
+    if fragment.startswith("^"):
+        prefix = fragment[1:]
+        return any(name.startswith(prefix) for name in names)
+    return any(fragment in name for name in names)
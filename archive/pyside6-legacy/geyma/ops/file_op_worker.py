@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class FileOpSignals(QObject):
+    progress = Signal(int)
+    current = Signal(str)
+    error = Signal(str)
+    finished = Signal()
+    itemResult = Signal(str, str, bool, str)
+
+
+@dataclass
+class FileOpPlan:
+    paths: list[str]
+    operation: Callable[[Path], Optional[str]]
+
+
+class FileOpWorker(QRunnable):
+    def __init__(self, paths: list[str], operation: Callable[[Path], Optional[str]]) -> None:
+        super().__init__()
+        self.signals = FileOpSignals()
+        self._plan = FileOpPlan(paths=list(paths), operation=operation)
+        self._cancel = False
+
+    def cancel(self) -> None:
+        self._cancel = True
+
+    def run(self) -> None:
+        total = len(self._plan.paths)
+        try:
+            for index, src in enumerate(self._plan.paths, start=1):
+                if self._cancel:
+                    break
+                source = Path(src)
+                if not source.exists():
+                    continue
+                self.signals.current.emit(source.name)
+                try:
+                    dest = self._plan.operation(source)
+                    if dest is not None:
+                        self.signals.itemResult.emit(src, dest, True, "")
+                except Exception as exc:
+                    # Report and keep going; one bad item must not abort the batch.
+                    self.signals.error.emit(str(exc))
+                    self.signals.itemResult.emit(src, "", False, str(exc))
+                self.signals.progress.emit(int((index / total) * 100))
+        finally:
+            # MainWindow only clears its active operation on finished.
+            self.signals.finished.emit()
+
+
+def remove_path(path: Path) -> str:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+    return ""
@@ -2,18 +2,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, time
-from pathlib import Path
 import os
-import re
+from time import monotonic
 from typing import Any
 
 from PySide6.QtCore import QObject, QRunnable, Signal
 
-_SIZE_RE = re.compile(r"^(?P<value>\\d+(?:\\.\\d+)?)(?P<unit>[KMGTP]?B)?$", re.IGNORECASE)
+_BATCH_SIZE = 64
+_BATCH_INTERVAL = 0.1
+_SIZE_UNITS = (
+    ("PB", 1024**5),
+    ("TB", 1024**4),
+    ("GB", 1024**3),
+    ("MB", 1024**2),
+    ("KB", 1024),
+    ("B", 1),
+)
 
 
 class SearchSignals(QObject):
-    found = Signal(str)
+    foundBatch = Signal(list)
     progress = Signal(int)
     finished = Signal()
     error = Signal(str)
@@ -21,7 +29,7 @@ class SearchSignals(QObject):
 
 @dataclass
 class SearchPlan:
-    root: Path
+    root: str
     query: str
     include_hidden: bool
     case_sensitive: bool
@@ -32,7 +40,7 @@ class SearchPlan:
 class SearchWorker(QRunnable):
     def __init__(
         self,
-        root: Path,
+        root: str | os.PathLike[str],
         query: str,
         include_hidden: bool,
         case_sensitive: bool,
@@ -41,7 +49,7 @@ class SearchWorker(QRunnable):
     ) -> None:
         super().__init__()
         self._plan = SearchPlan(
-            root=root,
+            root=os.fspath(root),
             query=query if case_sensitive else query.lower(),
             include_hidden=include_hidden,
             case_sensitive=case_sensitive,
@@ -55,44 +63,75 @@ class SearchWorker(QRunnable):
         self._cancel = True
 
     def run(self) -> None:
-        if not self._plan.root.exists():
+        plan = self._plan
+        if not os.path.exists(plan.root):
             self.signals.error.emit("Search root does not exist")
             self.signals.finished.emit()
             return
 
         total_scanned = 0
-        for dirpath, dirnames, filenames in os.walk(self._plan.root):
-            if self._cancel:
-                break
-            if not self._plan.include_hidden:
-                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-                filenames = [f for f in filenames if not f.startswith(".")]
-            for name in filenames + dirnames:
+        batch: list[str] = []
+        last_flush = monotonic()
+        # Depth-first over str paths with an explicit stack, so deep trees
+        # don't recurse and each DirEntry's cached type/stat is reused.
+        stack = [plan.root]
+        while stack and not self._cancel:
+            try:
+                with os.scandir(stack.pop()) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            files: list[os.DirEntry] = []
+            dirs: list[os.DirEntry] = []
+            for entry in entries:
+                if not plan.include_hidden and entry.name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (dirs if is_dir else files).append(entry)
+            for entry in files + dirs:
                 if self._cancel:
                     break
                 total_scanned += 1
-                haystack = name if self._plan.case_sensitive else name.lower()
-                if self._plan.query and self._plan.query not in haystack:
+                name = entry.name
+                haystack = name if plan.case_sensitive else name.lower()
+                if plan.query and plan.query not in haystack:
                     continue
-                candidate = Path(dirpath) / name
-                if self._plan.filters and not _match_filters(candidate, self._plan.filters):
+                if plan.filters and not _match_filters(entry, plan.filters):
                     continue
-                self.signals.found.emit(str(candidate))
+                batch.append(entry.path)
+                now = monotonic()
+                if len(batch) >= _BATCH_SIZE or now - last_flush >= _BATCH_INTERVAL:
+                    self.signals.foundBatch.emit(batch)
+                    batch = []
+                    last_flush = now
                 if total_scanned % 200 == 0:
                     self.signals.progress.emit(total_scanned)
-            if not self._plan.recursive:
-                break
-
+            if plan.recursive:
+                stack.extend(entry.path for entry in reversed(dirs) if not entry.is_symlink())
+            # A lone early match must not wait for the next hit (or the end of
+            # a long, fruitless walk) to reach the UI.
+            if batch:
+                now = monotonic()
+                if now - last_flush >= _BATCH_INTERVAL:
+                    self.signals.foundBatch.emit(batch)
+                    batch = []
+                    last_flush = now
+
+        if batch:
+            self.signals.foundBatch.emit(batch)
         self.signals.finished.emit()
 
 
-def _match_filters(path: Path, filters: list[dict]) -> bool:
+def _match_filters(dir_entry: os.DirEntry, filters: list[dict]) -> bool:
     try:
-        stat = path.stat()
+        stat = dir_entry.stat()
     except OSError:
         return False
-    name = path.name
-    path_str = str(path)
+    name = dir_entry.name
+    path_str = dir_entry.path
     for entry in filters:
         field = str(entry.get("field", "")).lower()
         op = str(entry.get("op", "")).lower()
@@ -133,22 +172,16 @@ def _parse_size(value: Any) -> int | None:
     text = str(value).strip()
     if text.isdigit():
         return int(text)
-    match = _SIZE_RE.match(text)
-    if not match:
-        return None
-    number = float(match.group("value"))
-    unit = (match.group("unit") or "B").upper()
-    multipliers = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-        "PB": 1024**5,
-    }
-    if unit not in multipliers:
+    text = text.upper()
+    multiplier = 1
+    for suffix, unit in _SIZE_UNITS:
+        if text.endswith(suffix):
+            text = text[: -len(suffix)]
+            multiplier = unit
+            break
+    if not text.replace(".", "", 1).isdigit():
         return None
-    return int(number * multipliers[unit])
+    return int(float(text) * multiplier)
 
 
 def _parse_date(value: Any) -> datetime | None:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-from urllib.parse import unquote
+from typing import Callable, Optional
+from urllib.parse import quote, unquote
 
 
 @dataclass
@@ -36,3 +38,60 @@ def parse_trash_info(path: Path) -> Optional[TrashInfo]:
     if original is None:
         return None
     return TrashInfo(original_path=original, deletion_date=deletion_date)
+
+
+def unique_trash_name(base: Path, name: str) -> str:
+    if not (base / name).exists():
+        return name
+    try:
+        with os.scandir(base) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = set()
+    candidate = name
+    counter = 1
+    while candidate in existing:
+        candidate = f"{name} {counter}"
+        counter += 1
+    return candidate
+
+
+def move_to_trash(
+    source: Path,
+    files_dir: Path,
+    info_dir: Path,
+    deletion_date: str,
+    write_info: bool = True,
+) -> str:
+    name = unique_trash_name(files_dir, source.name)
+    dest_path = files_dir / name
+    source_str = str(source)
+    try:
+        os.rename(source_str, dest_path)
+    except OSError:
+        shutil.move(source_str, str(dest_path))
+    if write_info:
+        encoded = quote(source_str, safe="/")
+        (info_dir / f"{name}.trashinfo").write_text(
+            f"[Trash Info]\nPath={encoded}\nDeletionDate={deletion_date}\n",
+            encoding="utf-8",
+        )
+    return str(dest_path)
+
+
+def restore_from_trash(
+    source: Path,
+    info_dir: Path,
+    resolve_collision: Callable[[Path], Path],
+) -> Optional[str]:
+    info_path = info_dir / f"{source.name}.trashinfo"
+    info = parse_trash_info(info_path)
+    if info is None:
+        return None
+    target = info.original_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target = resolve_collision(target)
+    shutil.move(str(source), str(target))
+    info_path.unlink(missing_ok=True)
+    return str(target)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class TrashSignals(QObject):
+    progress = Signal(int)
+    current = Signal(str)
+    error = Signal(str)
+    finished = Signal(bool)
+
+
+@dataclass
+class EmptyTrashPlan:
+    files_dir: Path
+    info_dir: Path
+
+
+class EmptyTrashWorker(QRunnable):
+    def __init__(self, files_dir: Path, info_dir: Path) -> None:
+        super().__init__()
+        self.signals = TrashSignals()
+        self._plan = EmptyTrashPlan(files_dir=files_dir, info_dir=info_dir)
+        self._cancel = False
+
+    def cancel(self) -> None:
+        self._cancel = True
+
+    def run(self) -> None:
+        try:
+            with os.scandir(self._plan.files_dir) as it:
+                entries = list(it)
+        except OSError as exc:
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit(False)
+            return
+
+        total = len(entries)
+        for index, entry in enumerate(entries, start=1):
+            if self._cancel:
+                self.signals.finished.emit(False)
+                return
+            self.signals.current.emit(entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                self.signals.error.emit(str(exc))
+                self.signals.finished.emit(False)
+                return
+            self.signals.progress.emit(int((index / total) * 100))
+
+        try:
+            with os.scandir(self._plan.info_dir) as it:
+                for entry in it:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit(False)
+            return
+
+        self.signals.progress.emit(100)
+        self.signals.finished.emit(True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -9,7 +10,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from geyma.ai.jobs.folder_summary import summarize_folder
+from geyma.ai.jobs.folder_summary import FolderStats, FolderSummaryWorker, summarize_folder
 from geyma.ui.ai_data_preview_dialog import AIDataPreviewDialog
 from geyma.ui.dialog_utils import apply_dialog_titlebar
 from geyma.utils.config import ConfigStore
@@ -23,6 +24,8 @@ class FolderSummaryDialog(QDialog):
         self._path = path
         self._include_hidden = include_hidden
         self._config = ConfigStore()
+        self._cancel_scan = False
+        self._scanning = False
 
         self._header = QLabel(f"Summary for: {path}")
         self._header.setWordWrap(True)
@@ -56,8 +59,34 @@ class FolderSummaryDialog(QDialog):
         self._refresh()
         apply_dialog_titlebar(self)
 
+    def done(self, result: int) -> None:
+        self._cancel_scan = True
+        super().done(result)
+
     def _refresh(self) -> None:
-        local_result = summarize_folder(self._path, include_hidden=self._include_hidden, allow_ai=False)
+        if self._scanning:
+            return
+        self._scanning = True
+        self._summary.setText("Scanning folder...")
+        self._stats_table.setRowCount(0)
+        self._ai_label.setVisible(False)
+        self._error.setText("")
+        worker = FolderSummaryWorker(self._path, self._include_hidden, lambda: self._cancel_scan)
+        worker.signals.finished.connect(self._on_stats_ready)
+        worker.signals.canceled.connect(self._on_scan_canceled)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_scan_canceled(self) -> None:
+        self._scanning = False
+
+    def _on_stats_ready(self, stats: FolderStats) -> None:
+        self._scanning = False
+        if self._cancel_scan or not self.isVisible():
+            # Closed while scanning; don't pop the AI preview over nothing.
+            return
+        local_result = summarize_folder(
+            self._path, include_hidden=self._include_hidden, allow_ai=False, stats=stats
+        )
         result = local_result
         if self._config.get_bool("ai_enabled", False):
             dialog = AIDataPreviewDialog(
@@ -67,7 +96,9 @@ class FolderSummaryDialog(QDialog):
                 self,
             )
             if dialog.exec() == QDialog.Accepted:
-                result = summarize_folder(self._path, include_hidden=self._include_hidden, allow_ai=True)
+                result = summarize_folder(
+                    self._path, include_hidden=self._include_hidden, allow_ai=True, stats=stats
+                )
         stats = result.get("stats", {})
         summary_text = result.get("text") or "No AI summary available."
         self._summary.setText(summary_text)
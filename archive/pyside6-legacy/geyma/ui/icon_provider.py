@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from collections import OrderedDict
+from functools import lru_cache
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QImageReader, QPixmap
@@ -81,7 +80,15 @@ class ThumbnailIconProvider(QFileIconProvider):
 
     @staticmethod
     def _is_image(path: str) -> bool:
-        suffix = Path(path).suffix.lower().lstrip(".")
-        if not suffix:
+        stem, _, suffix = path.rpartition("/")[2].rpartition(".")
+        if not stem or not suffix:
             return False
-        return suffix.encode() in QImageReader.supportedImageFormats()
+        return suffix.lower() in _supported_image_suffixes()
+
+
+@lru_cache(maxsize=1)
+def _supported_image_suffixes() -> frozenset[str]:
+    return frozenset(
+        bytes(fmt.data()).decode("ascii", "ignore").lower()
+        for fmt in QImageReader.supportedImageFormats()
+    )
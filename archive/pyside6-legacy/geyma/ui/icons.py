@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtGui import QIcon
@@ -12,7 +13,7 @@ def themed_icon(
 ) -> QIcon:
     names = [name] if isinstance(name, str) else list(name)
     for candidate in names:
-        icon = QIcon.fromTheme(candidate)
+        icon = _theme_icon(candidate)
         if not icon.isNull():
             return icon
     if fallback is None:
@@ -23,6 +24,11 @@ def themed_icon(
     return app.style().standardIcon(fallback)
 
 
+@lru_cache(maxsize=128)
+def _theme_icon(name: str) -> QIcon:
+    return QIcon.fromTheme(name)
+
+
 def file_item_icon(path: str, *, is_dir: bool) -> QIcon:
     target = Path(path).expanduser()
     if is_dir:
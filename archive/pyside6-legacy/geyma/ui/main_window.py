@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
 import os
-import shutil
+import stat
 import sys
-from urllib.parse import quote
+from typing import Callable
 
 from PySide6.QtCore import (
     QByteArray,
@@ -18,6 +20,7 @@ from PySide6.QtCore import (
     QFileSystemWatcher,
     QItemSelectionModel,
     QModelIndex,
+    QPersistentModelIndex,
 )
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
@@ -40,8 +43,8 @@ from PySide6.QtWidgets import (
     QStatusBar,
     QToolButton,
     QToolBar,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QHeaderView,
+    QTreeView,
     QAbstractItemView,
     QVBoxLayout,
     QWidget,
@@ -60,14 +63,23 @@ from geyma.ui.icon_provider import ThumbnailIconProvider
 from geyma.ai.jobs.text_to_filters import translate_query
 from geyma.ui.ai_data_preview_dialog import AIDataPreviewDialog
 from geyma.ui.filters_dialog import FiltersDialog
-from geyma.ui.models import FilterProxyModel, ValidatingFileSystemModel
+from geyma.ui.models import ActivityModel, FilterProxyModel, ValidatingFileSystemModel
 from geyma.ui.properties_dialog import PropertiesDialog
 from geyma.ui.progress_dialog import OperationProgressDialog
 from geyma.ui.sidebar import PlacesSidebar
+from geyma.ops.activity_worker import (
+    ActivityFilterWorker,
+    entry_matches_working_set,
+    working_set_anchors,
+)
 from geyma.ops.transfer_worker import TransferItem, TransferWorker
-from geyma.ops.trash_utils import parse_trash_info
+from geyma.ops.file_op_worker import FileOpWorker, remove_path
+from geyma.ops.trash_utils import move_to_trash, restore_from_trash
+from geyma.ops.trash_worker import EmptyTrashWorker
 from geyma.utils.config import ConfigStore
-from geyma.utils.operation_log import OperationLog
+from geyma.utils.desktop_open import open_commands
+from geyma.utils.formatting import format_size
+from geyma.utils.operation_log import OperationLog, parse_timestamp
 from geyma.utils.working_sets import WorkingSetStore
 from geyma.ops.search_worker import SearchWorker
 from geyma.ui.rename_suggestions_dialog import RenameSuggestionsDialog
@@ -75,6 +87,30 @@ from geyma.ui.settings_dialog import SettingsDialog
 from geyma.ui.style import build_stylesheet
 from geyma.ui.title_bar import TitleBar
 
+_RECENT_LIMIT = 10
+_ACTIVITY_ROW_LIMIT = 500
+_CONFIG_SAVE_DELAY_MS = 500
+_FILTER_DELAY_MS = 150
+_IMAGE_SUFFIXES = frozenset({"png", "jpg", "jpeg", "webp", "gif", "bmp", "tif", "tiff"})
+
+
+@lru_cache(maxsize=32)
+def _filter_regex(text: str) -> QRegularExpression:
+    if not text:
+        return QRegularExpression()
+    return QRegularExpression(
+        QRegularExpression.escape(text), QRegularExpression.CaseInsensitiveOption
+    )
+
+
+@dataclass(frozen=True)
+class _MenuEntry:
+    title: str = ""
+    visible: Callable[[dict], bool] | None = None
+    handler: Callable | None = None
+    kind: str = "action"
+    pass_index: bool = True
+
 
 class MainWindow(QMainWindow):
     def __init__(self, start_path: str | None = None) -> None:
@@ -83,6 +119,7 @@ class MainWindow(QMainWindow):
         self.resize(1100, 720)
 
         self._config = ConfigStore()
+        self._applied_settings: dict[str, object] = {}
         self._apply_style()
         if start_path:
             initial_path = Path(start_path).expanduser()
@@ -135,12 +172,24 @@ class MainWindow(QMainWindow):
         self._file_views.apply_sort(self._sort_column, self._sort_order)
         self._file_views.list_view.header().sortIndicatorChanged.connect(self._on_sort_indicator_changed)
         self._file_views.set_root_index(self._proxy.mapFromSource(self._model.index(initial_path_str)))
+        self._selection_status_timer = QTimer(self)
+        self._selection_status_timer.setSingleShot(True)
+        self._selection_status_timer.setInterval(50)
+        self._selection_status_timer.timeout.connect(self._refresh_selection_status)
+        self._last_status_key: tuple[int, int, int] | None = None
+        self._last_status_message = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self._file_views.selectionChanged.connect(self._update_selection_status)
         self._apply_thumbnail_mode()
 
         self._places = PlacesSidebar(self)
         self._working_sets = WorkingSetStore(self._config)
-        self._places.set_working_sets(self._serialize_working_sets())
+        self._sidebar_working_sets: list[dict] | None = None
+        self._sidebar_sync_pending = False
+        self._sync_sidebar_working_sets()
         self._places.workingSetActivated.connect(self._open_working_set)
         self._places.workingSetRenameRequested.connect(self._rename_working_set)
         self._places.workingSetDeleteRequested.connect(self._delete_working_set)
@@ -191,7 +240,7 @@ class MainWindow(QMainWindow):
         splitter.addWidget(self._view_container)
         splitter.setStretchFactor(1, 1)
         splitter.setChildrenCollapsible(False)
-        QTimer.singleShot(0, lambda: splitter.setSizes([220, 1]))
+        QTimer.singleShot(0, partial(splitter.setSizes, [220, 1]))
 
         content = QWidget()
         content_layout = QVBoxLayout(content)
@@ -212,10 +261,14 @@ class MainWindow(QMainWindow):
         self._history: list[str] = [initial_path_str]
         self._history_index = 0
         self._inline_search_worker: SearchWorker | None = None
+        self._activity_worker: ActivityFilterWorker | None = None
+        self._activity_request = 0
         self._inline_search_filters: list[dict] = []
         self._working_set_id: str | None = None
+        self._working_set_path_index: dict[str, QListWidgetItem] = {}
         self._op_log = OperationLog(self._config)
         self._current_path = initial_path_str
+        self._current_path_obj = Path(initial_path_str)
         self._clipboard_paths: list[str] = []
         self._clipboard_mode: str | None = None
         self._confirm_delete = self._config.get_bool("confirm_delete", True)
@@ -230,11 +283,40 @@ class MainWindow(QMainWindow):
         self._trash_delete_info = self._config.get_bool("trash_write_info", True)
         self._track_recent = self._config.get_bool("track_recent", False)
         self._warn_executables = self._config.get_bool("warn_executables", True)
+        self._status_bar_details = self._config.get_bool("status_bar_details", True)
+        self._size_units = self._config.get_str("size_units", "auto").upper()
+        self._ai_enabled = self._config.get_bool("ai_enabled", False)
+        self._open_with_last_enabled = self._config.get_bool("enable_open_with_last", True)
+        self._recent_paths: list[str] = list(self._config.get("recent_paths", []))
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(_CONFIG_SAVE_DELAY_MS)
+        self._config_save_timer.timeout.connect(self._config.save)
         self._active_transfer: TransferWorker | None = None
         self._active_progress: OperationProgressDialog | None = None
         self._active_image_worker: ImageGenerationWorker | None = None
         self._active_image_progress: OperationProgressDialog | None = None
+        self._active_trash_worker: EmptyTrashWorker | None = None
+        self._active_trash_progress: OperationProgressDialog | None = None
+        self._active_file_op: FileOpWorker | None = None
+        self._active_file_op_progress: OperationProgressDialog | None = None
+        self._file_op_action = ""
+        self._file_op_sources: list[str] = []
+        self._file_op_destinations: list[str] = []
+        self._item_menu_spec = self._build_item_menu_spec()
+        self._item_menu: QMenu | None = None
+        self._item_menu_actions: list[tuple[_MenuEntry, QAction]] = []
+        self._working_set_menu_sets: list[tuple[str, str]] = []
+        self._item_menu_index = QPersistentModelIndex()
+        self._blank_menu: QMenu | None = None
+        self._open_with_dialog: QFileDialog | None = None
+        self._activity_menu: QMenu | None = None
+        self._working_set_menu: QMenu | None = None
+        self._working_set_existing_actions: list[QAction] = []
+        self._inline_search_menu: QMenu | None = None
         self._watcher = QFileSystemWatcher(self)
+        self._refresh_pending = False
+        self._pending_hidden: bool | None = None
         self._refresh_timer = QTimer(self)
         self._refresh_timer.setSingleShot(True)
         self._refresh_timer.setInterval(250)
@@ -248,7 +330,7 @@ class MainWindow(QMainWindow):
         self._restore_window_state()
 
         self._path_edit.returnPressed.connect(self._go_to_path)
-        self._places.pathActivated.connect(lambda path: self._go_to(Path(path)))
+        self._places.pathActivated.connect(self._go_to_place)
         self._places.openInNewWindow.connect(self._open_path_in_new_window)
         self._places.showProperties.connect(self._show_path_properties)
         self._file_views.itemActivated.connect(self._go_to_index)
@@ -258,14 +340,16 @@ class MainWindow(QMainWindow):
         self._sync_places_selection(initial_path_str)
         self._setup_shortcuts()
         self._set_watched_path(initial_path_str)
-        self._proxy.rowsInserted.connect(self._update_empty_state)
-        self._proxy.rowsRemoved.connect(self._update_empty_state)
-        self._proxy.modelReset.connect(self._update_empty_state)
+        self._empty_state_timer = QTimer(self)
+        self._empty_state_timer.setSingleShot(True)
+        self._empty_state_timer.setInterval(50)
+        self._empty_state_timer.timeout.connect(self._update_empty_state)
+        self._proxy.rowsInserted.connect(self._on_proxy_rows_changed)
+        self._proxy.rowsRemoved.connect(self._on_proxy_rows_changed)
+        self._proxy.modelReset.connect(self._empty_state_timer.start)
         self._update_empty_state()
 
-        self.destroyed.connect(self._save_state)
-        if self._config.get_bool("clear_history_on_exit", False):
-            self.destroyed.connect(self._clear_history)
+        self._clear_history_on_exit = self._config.get_bool("clear_history_on_exit", False)
 
     def _build_toolbar(self) -> None:
         toolbar = QToolBar("Main")
@@ -301,7 +385,7 @@ class MainWindow(QMainWindow):
             self,
         )
         recursive_search_action.setShortcut("Ctrl+Shift+F")
-        recursive_search_action.triggered.connect(lambda: self._show_inline_search("recursive"))
+        recursive_search_action.triggered.connect(partial(self._show_inline_search, "recursive"))
         summary_action = QAction(
             themed_icon(["view-list-details", "document-properties"], QStyle.SP_FileDialogDetailedView),
             "Folder Summary",
@@ -361,7 +445,7 @@ class MainWindow(QMainWindow):
         self._search_edit.setPlaceholderText("Filter current folder")
         self._search_edit.setMinimumWidth(220)
         self._search_edit.setClearButtonEnabled(True)
-        self._search_edit.textChanged.connect(self._apply_filter)
+        self._search_edit.textChanged.connect(self._schedule_filter)
         toolbar.addWidget(self._search_edit)
         filter_button = QToolButton()
         filter_button.setText("Filters")
@@ -388,10 +472,10 @@ class MainWindow(QMainWindow):
         menu.addAction(recursive_search_action)
         menu.addAction(summary_action)
         menu.addAction(activity_action)
-        if self._config.get_bool("ai_enabled", False):
+        if self._ai_enabled:
             menu.addSeparator()
             ai_generate_action = menu.addAction("Generate Image Here…")
-            ai_generate_action.triggered.connect(lambda: self._open_image_generation(mode="new"))
+            ai_generate_action.triggered.connect(partial(self._open_image_generation, mode="new"))
 
         button = QToolButton()
         button.setText("Tools")
@@ -454,7 +538,7 @@ class MainWindow(QMainWindow):
 
         recursive_search_action = QAction(self)
         recursive_search_action.setShortcut("Ctrl+Shift+F")
-        recursive_search_action.triggered.connect(lambda: self._show_inline_search("recursive"))
+        recursive_search_action.triggered.connect(partial(self._show_inline_search, "recursive"))
         self.addAction(recursive_search_action)
 
         permanent_delete_action = QAction(self)
@@ -480,6 +564,10 @@ class MainWindow(QMainWindow):
         self._view_toggle.setToolTip("Toggle view mode")
         self._view_toggle.toggled.connect(self._toggle_view_mode)
         self._view_toggle.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        self._view_icons = (
+            themed_icon(["view-list-details", "format-list-unordered"], QStyle.SP_FileDialogDetailedView),
+            themed_icon(["view-grid", "view-grid-symbolic"], QStyle.SP_FileDialogListView),
+        )
         self._update_view_toggle_ui()
         return self._view_toggle
 
@@ -493,12 +581,12 @@ class MainWindow(QMainWindow):
         asc_action = menu.addAction("Ascending")
         desc_action = menu.addAction("Descending")
 
-        name_action.triggered.connect(lambda: self._set_sort_column(0))
-        size_action.triggered.connect(lambda: self._set_sort_column(1))
-        type_action.triggered.connect(lambda: self._set_sort_column(2))
-        modified_action.triggered.connect(lambda: self._set_sort_column(3))
-        asc_action.triggered.connect(lambda: self._set_sort_order(Qt.AscendingOrder))
-        desc_action.triggered.connect(lambda: self._set_sort_order(Qt.DescendingOrder))
+        name_action.triggered.connect(partial(self._set_sort_column, 0))
+        size_action.triggered.connect(partial(self._set_sort_column, 1))
+        type_action.triggered.connect(partial(self._set_sort_column, 2))
+        modified_action.triggered.connect(partial(self._set_sort_column, 3))
+        asc_action.triggered.connect(partial(self._set_sort_order, Qt.AscendingOrder))
+        desc_action.triggered.connect(partial(self._set_sort_order, Qt.DescendingOrder))
 
         self._sort_menu = menu
         button = QToolButton()
@@ -518,8 +606,17 @@ class MainWindow(QMainWindow):
 
     def _apply_style(self) -> None:
         app = QApplication.instance()
-        if app is not None:
-            app.setStyleSheet(build_stylesheet(self._config))
+        if app is None:
+            return
+        stylesheet = build_stylesheet(self._config)
+        if self._setting_changed("stylesheet", stylesheet):
+            app.setStyleSheet(stylesheet)
+
+    def _setting_changed(self, key: str, value: object) -> bool:
+        if key in self._applied_settings and self._applied_settings[key] == value:
+            return False
+        self._applied_settings[key] = value
+        return True
 
     def _go_to_path(self) -> None:
         raw_path = self._path_edit.text().strip()
@@ -533,7 +630,8 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Path does not exist")
             return
 
-        resolved = str(path.resolve())
+        resolved_path = path.resolve()
+        resolved = str(resolved_path)
         if record_history:
             if self._history_index < len(self._history) - 1:
                 self._history = self._history[: self._history_index + 1]
@@ -542,6 +640,7 @@ class MainWindow(QMainWindow):
                 self._history_index = len(self._history) - 1
 
         self._current_path = resolved
+        self._current_path_obj = resolved_path
         self._set_root_index(resolved)
         self._path_edit.setText(resolved)
         self._update_breadcrumbs(resolved)
@@ -552,11 +651,23 @@ class MainWindow(QMainWindow):
         self._empty_trash_action.setEnabled(resolved == self._trash_path)
         self._config.set("last_path", resolved)
         if self._track_recent:
-            recent = list(self._config.get("recent_paths", []))
-            if resolved in recent:
-                recent.remove(resolved)
-            recent.insert(0, resolved)
-            self._config.set("recent_paths", recent[:10])
+            if resolved in self._recent_paths:
+                self._recent_paths.remove(resolved)
+            self._recent_paths.insert(0, resolved)
+            del self._recent_paths[_RECENT_LIMIT:]
+            self._config.set("recent_paths", list(self._recent_paths))
+        self._schedule_config_save()
+
+    def _schedule_config_save(self) -> None:
+        self._config_save_timer.start()
+
+    def _flush_config_save(self) -> None:
+        if self._config_save_timer.isActive():
+            self._config_save_timer.stop()
+            self._config.save()
+
+    def _go_to_place(self, path: str) -> None:
+        self._go_to(Path(path))
 
     def _go_back(self) -> None:
         if self._history_index <= 0:
@@ -571,7 +682,7 @@ class MainWindow(QMainWindow):
         self._go_to(Path(self._history[self._history_index]), record_history=False)
 
     def _go_up(self) -> None:
-        current = Path(self._current_path)
+        current = self._current_path_obj
         parent = current.parent if current.parent != current else current
         self._go_to(parent)
 
@@ -584,6 +695,17 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Refreshed")
         self._update_empty_state()
 
+    def _request_refresh(self) -> None:
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._refresh_pending = False
+        self._set_root_index(self._current_path)
+        self._update_empty_state()
+
     def _set_watched_path(self, path: str) -> None:
         directories = self._watcher.directories()
         files = self._watcher.files()
@@ -606,34 +728,43 @@ class MainWindow(QMainWindow):
 
     def _update_view_toggle_ui(self) -> None:
         checked = bool(self._view_toggle.isChecked())
+        self._view_toggle.setIcon(self._view_icons[int(checked)])
         if checked:
             self._view_toggle.setText("Grid")
-            self._view_toggle.setIcon(
-                themed_icon(["view-grid", "view-grid-symbolic"], QStyle.SP_FileDialogListView)
-            )
             self._view_toggle.setToolTip("Grid view")
         else:
             self._view_toggle.setText("List")
-            self._view_toggle.setIcon(
-                themed_icon(["view-list-details", "format-list-unordered"], QStyle.SP_FileDialogDetailedView)
-            )
             self._view_toggle.setToolTip("List view")
 
+    def closeEvent(self, event) -> None:
+        # Flush while the widget is still alive; by the time destroyed fires
+        # the C++ side (timer, geometry) is gone.
+        if self._clear_history_on_exit:
+            self._clear_history()
+        self._save_state()
+        super().closeEvent(event)
+
     def _save_state(self) -> None:
+        self._config_save_timer.stop()
         if self._config.get_bool("remember_window", True):
             geometry = self.saveGeometry()
             self._config.set("window_geometry", geometry.toBase64().data().decode("ascii"))
         self._config.save()
 
     def _clear_history(self) -> None:
+        self._recent_paths.clear()
         self._config.set("recent_paths", [])
-        self._config.save()
 
     def _debounced_refresh(self, _path: str) -> None:
         if self._refresh_timer.isActive():
             self._refresh_timer.stop()
         self._refresh_timer.start()
 
+    def _on_proxy_rows_changed(self, parent: QModelIndex, _first: int, _last: int) -> None:
+        if parent != self._file_views.active_view.rootIndex():
+            return
+        self._empty_state_timer.start()
+
     def _update_empty_state(self) -> None:
         if self._inline_search_panel.isVisible():
             self._empty_wrapper.setVisible(False)
@@ -715,7 +846,7 @@ class MainWindow(QMainWindow):
             button.setFlat(True)
             button.setProperty("breadcrumb-index", idx)
             target = str(current)
-            button.clicked.connect(lambda _checked=False, p=target: self._go_to(Path(p)))
+            button.clicked.connect(partial(self._go_to, Path(target)))
             self._breadcrumb_layout.addWidget(button)
 
             if idx < len(parts) - 1:
@@ -730,44 +861,45 @@ class MainWindow(QMainWindow):
         self._places.sync_selection(path)
 
     def _update_selection_status(self) -> None:
-        if not self._config.get_bool("status_bar_details", True):
+        self._selection_status_timer.start()
+
+    def _refresh_selection_status(self) -> None:
+        if not self._status_bar_details:
             self.statusBar().showMessage(self._current_path)
             return
         selection_model = self._file_views.active_view.selectionModel()
         if selection_model is None:
             return
 
-        indexes = selection_model.selectedIndexes()
-        if not indexes:
+        primaries = self._selected_primary_indexes(selection_model)
+        if not primaries:
             self.statusBar().showMessage(self._current_path)
             return
 
-        paths: set[str] = set()
+        item_count = 0
         total_bytes = 0
         file_count = 0
-        for index in indexes:
-            primary = index.siblingAtColumn(0)
-            if not primary.isValid():
-                continue
+        for primary in primaries:
             source_primary = self._proxy.mapToSource(primary)
             if not source_primary.isValid():
                 continue
-            path = self._model.filePath(source_primary)
-            if path in paths:
-                continue
-            paths.add(path)
-            info = self._model.fileInfo(source_primary)
-            if info.isFile():
+            item_count += 1
+            if not self._model.isDir(source_primary):
                 file_count += 1
-                total_bytes += info.size()
+                total_bytes += self._model.size(source_primary)
 
-        item_count = len(paths)
+        status_key = (item_count, file_count, total_bytes)
+        status_bar = self.statusBar()
+        if status_key == self._last_status_key and status_bar.currentMessage() == self._last_status_message:
+            return
         if file_count:
             size_text = self._format_bytes(total_bytes)
             message = f"{item_count} items, {file_count} files, {size_text}"
         else:
             message = f"{item_count} items"
-        self.statusBar().showMessage(message)
+        self._last_status_key = status_key
+        self._last_status_message = message
+        status_bar.showMessage(message)
 
     def _show_view_context_menu(self, position, view) -> None:
         index = view.indexAt(position)
@@ -777,118 +909,115 @@ class MainWindow(QMainWindow):
         else:
             self._show_blank_context_menu(global_pos)
 
-    def _show_item_context_menu(self, index, global_pos) -> None:
+    def _build_item_menu_spec(self) -> list[_MenuEntry]:
+        return [
+            _MenuEntry("Open", handler=self._open_index),
+            _MenuEntry("Open with…", handler=self._open_with_index),
+            _MenuEntry("Open with Last Used", lambda ctx: ctx["open_with_last"], self._open_with_last),
+            _MenuEntry("Open in New Window", lambda ctx: ctx["is_dir"], self._open_in_new_window),
+            _MenuEntry(kind="separator"),
+            _MenuEntry("Copy", handler=self._copy_selection, pass_index=False),
+            _MenuEntry("Cut", handler=self._cut_selection, pass_index=False),
+            _MenuEntry(
+                "Paste",
+                lambda ctx: ctx["has_clipboard"],
+                self._paste_into_current,
+                pass_index=False,
+            ),
+            _MenuEntry(kind="separator"),
+            _MenuEntry("Rename", handler=self._rename_index),
+            _MenuEntry("AI Rename Suggestions", lambda ctx: ctx["ai"], self._open_ai_rename),
+            _MenuEntry("Working Set", handler=self._populate_working_set_menu, kind="submenu"),
+            _MenuEntry(
+                "Restore from Trash",
+                lambda ctx: ctx["can_restore"],
+                self._restore_from_trash_selection,
+                pass_index=False,
+            ),
+            _MenuEntry(
+                "Move to Trash",
+                lambda ctx: not ctx["can_restore"],
+                self._move_to_trash_selection,
+                pass_index=False,
+            ),
+            _MenuEntry(
+                "Generate Variation…",
+                lambda ctx: ctx["ai"] and ctx["is_image"],
+                partial(self._open_image_generation, mode="variation"),
+            ),
+            _MenuEntry(
+                "Edit Image with Prompt…",
+                lambda ctx: ctx["ai"] and ctx["is_image"],
+                partial(self._open_image_generation, mode="edit"),
+            ),
+            _MenuEntry("Folder Summary", lambda ctx: ctx["is_dir"], self._open_folder_summary_index),
+            _MenuEntry("Properties", handler=self._show_properties),
+        ]
+
+    def _build_item_menu(self) -> QMenu:
         menu = QMenu(self)
+        self._item_menu_actions = []
+        for entry in self._item_menu_spec:
+            if entry.kind == "separator":
+                action = menu.addSeparator()
+            elif entry.kind == "submenu":
+                submenu = menu.addMenu(entry.title)
+                submenu.aboutToShow.connect(partial(entry.handler, submenu))
+                action = submenu.menuAction()
+            else:
+                action = menu.addAction(entry.title)
+                if entry.pass_index:
+                    action.triggered.connect(partial(self._run_item_menu_handler, entry.handler))
+                else:
+                    action.triggered.connect(entry.handler)
+            self._item_menu_actions.append((entry, action))
+        return menu
+
+    def _run_item_menu_handler(self, handler: Callable) -> None:
+        if not self._item_menu_index.isValid():
+            return
+        handler(QModelIndex(self._item_menu_index))
+
+    def _show_item_context_menu(self, index, global_pos) -> None:
+        if self._item_menu is None:
+            self._item_menu = self._build_item_menu()
+        self._item_menu_index = QPersistentModelIndex(index)
         source_index = self._proxy.mapToSource(index)
         is_dir = source_index.isValid() and self._model.isDir(source_index)
-        ai_enabled = self._config.get_bool("ai_enabled", False)
-        has_clipboard = bool(self._clipboard_paths and self._clipboard_mode)
-        in_trash = self._current_path == self._trash_path
-        trash_write_info = self._trash_delete_info
-        is_image = self._is_image_index(source_index)
-        open_with_last_available = (
-            self._config.get_bool("enable_open_with_last", True)
-            and bool(self._config.get("last_open_with_app"))
-        )
-
-        open_action = menu.addAction("Open")
-        open_with_action = menu.addAction("Open with…")
-        if open_with_last_available:
-            open_with_last_action = menu.addAction("Open with Last Used")
-        else:
-            open_with_last_action = None
-        if is_dir:
-            open_window_action = menu.addAction("Open in New Window")
-        else:
-            open_window_action = None
-        menu.addSeparator()
-        copy_action = menu.addAction("Copy")
-        cut_action = menu.addAction("Cut")
-        if has_clipboard:
-            paste_action = menu.addAction("Paste")
-        else:
-            paste_action = None
-        menu.addSeparator()
-        rename_action = menu.addAction("Rename")
-        if ai_enabled:
-            ai_rename_action = menu.addAction("AI Rename Suggestions")
-        else:
-            ai_rename_action = None
-        working_set_menu = menu.addMenu("Working Set")
-        if in_trash and trash_write_info:
-            restore_action = menu.addAction("Restore from Trash")
-            trash_action = None
-        else:
-            trash_action = menu.addAction("Move to Trash")
-            restore_action = None
-        if ai_enabled and is_image:
-            generate_variation_action = menu.addAction("Generate Variation…")
-            edit_image_action = menu.addAction("Edit Image with Prompt…")
-        else:
-            generate_variation_action = None
-            edit_image_action = None
-        if is_dir:
-            summary_action = menu.addAction("Folder Summary")
-        else:
-            summary_action = None
-        properties_action = menu.addAction("Properties")
-
-        open_action.triggered.connect(lambda: self._open_index(index))
-        open_with_action.triggered.connect(lambda: self._open_with_index(index))
-        if open_with_last_action is not None:
-            open_with_last_action.triggered.connect(lambda: self._open_with_last(index))
-        if open_window_action is not None:
-            open_window_action.triggered.connect(lambda: self._open_in_new_window(index))
-        copy_action.triggered.connect(self._copy_selection)
-        cut_action.triggered.connect(self._cut_selection)
-        if paste_action is not None:
-            paste_action.triggered.connect(self._paste_into_current)
-        rename_action.triggered.connect(lambda: self._rename_index(index))
-        if ai_rename_action is not None:
-            ai_rename_action.triggered.connect(lambda: self._open_ai_rename(index))
-        if trash_action is not None:
-            trash_action.triggered.connect(self._move_to_trash_selection)
-        if restore_action is not None:
-            restore_action.triggered.connect(self._restore_from_trash_selection)
-        properties_action.triggered.connect(lambda: self._show_properties(index))
-        if summary_action is not None:
-            summary_action.triggered.connect(lambda: self._open_folder_summary_index(index))
-        if generate_variation_action is not None:
-            generate_variation_action.triggered.connect(
-                lambda: self._open_image_generation(index, mode="variation")
-            )
-        if edit_image_action is not None:
-            edit_image_action.triggered.connect(lambda: self._open_image_generation(index, mode="edit"))
-        self._populate_working_set_menu(working_set_menu)
-        menu.exec(global_pos)
+        ctx = {
+            "is_dir": is_dir,
+            "ai": self._ai_enabled,
+            "has_clipboard": bool(self._clipboard_paths and self._clipboard_mode),
+            "can_restore": self._current_path == self._trash_path and self._trash_delete_info,
+            "is_image": self._ai_enabled and self._is_image_index(source_index),
+            "open_with_last": self._open_with_last_enabled
+            and bool(self._config.get("last_open_with_app")),
+        }
+        for entry, action in self._item_menu_actions:
+            action.setVisible(entry.visible is None or bool(entry.visible(ctx)))
+        self._item_menu.popup(global_pos)
+
+    def _build_blank_menu(self) -> QMenu:
+        menu = QMenu(self)
+        menu.addAction("New Folder").triggered.connect(self._create_new_folder)
+        menu.addAction("New File").triggered.connect(self._create_new_file)
+        self._blank_paste_action = menu.addAction("Paste")
+        self._blank_paste_action.triggered.connect(self._paste_into_current)
+        self._blank_generate_action = menu.addAction("Generate Image Here…")
+        self._blank_generate_action.triggered.connect(self._open_image_generation)
+        menu.addMenu(self._sort_menu)
+        self._blank_hidden_action = menu.addAction("Show Hidden")
+        self._blank_hidden_action.setCheckable(True)
+        self._blank_hidden_action.toggled.connect(self._hidden_action.setChecked)
+        return menu
 
     def _show_blank_context_menu(self, global_pos) -> None:
-        menu = QMenu(self)
-        new_folder_action = menu.addAction("New Folder")
-        new_file_action = menu.addAction("New File")
-        has_clipboard = bool(self._clipboard_paths and self._clipboard_mode)
-        ai_enabled = self._config.get_bool("ai_enabled", False)
-        if has_clipboard:
-            paste_action = menu.addAction("Paste")
-        else:
-            paste_action = None
-        if ai_enabled:
-            generate_action = menu.addAction("Generate Image Here…")
-        else:
-            generate_action = None
-        sort_menu = menu.addMenu(self._sort_menu)
-        show_hidden_action = menu.addAction("Show Hidden")
-        show_hidden_action.setCheckable(True)
-        show_hidden_action.setChecked(self._hidden_action.isChecked())
-        new_folder_action.triggered.connect(self._create_new_folder)
-        new_file_action.triggered.connect(self._create_new_file)
-        if paste_action is not None:
-            paste_action.triggered.connect(self._paste_into_current)
-        if generate_action is not None:
-            generate_action.triggered.connect(self._open_image_generation)
-        show_hidden_action.toggled.connect(self._hidden_action.setChecked)
-        _ = sort_menu
-        menu.exec(global_pos)
+        if self._blank_menu is None:
+            self._blank_menu = self._build_blank_menu()
+        self._blank_paste_action.setVisible(bool(self._clipboard_paths and self._clipboard_mode))
+        self._blank_generate_action.setVisible(self._ai_enabled)
+        self._blank_hidden_action.setChecked(self._hidden_action.isChecked())
+        self._blank_menu.popup(global_pos)
 
     def _open_index(self, index) -> None:
         source_index = self._proxy.mapToSource(index)
@@ -924,7 +1053,7 @@ class MainWindow(QMainWindow):
         if not self._open_default_app:
             self.statusBar().showMessage("Opening files in default apps is disabled")
             return
-        if self._warn_executables and Path(path).is_file() and os.access(path, os.X_OK):
+        if self._warn_executables and self._is_executable_file(path):
             reply = QMessageBox.warning(
                 self,
                 "Open Executable",
@@ -936,31 +1065,21 @@ class MainWindow(QMainWindow):
         if not self._open_path(path):
             self.statusBar().showMessage("Failed to open file")
 
+    @staticmethod
+    def _is_executable_file(path: str) -> bool:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
     def _open_path(self, path: str) -> bool:
         preferred = self._config.get_str("open_backend", "auto").lower()
-        candidates = self._open_candidates(path, preferred)
-        for command, args in candidates:
-            if shutil.which(command) and QProcess.startDetached(command, args):
+        for command, args in open_commands(preferred):
+            if QProcess.startDetached(command, [*args, path]):
                 return True
         return False
 
-    @staticmethod
-    def _open_candidates(path: str, preferred: str) -> list[tuple[str, list[str]]]:
-        kde = [
-            ("kioclient6", ["exec", path]),
-            ("kioclient5", ["exec", path]),
-            ("kde-open5", [path]),
-        ]
-        gio = [("gio", ["open", path])]
-        xdg = [("xdg-open", [path])]
-        if preferred == "kde":
-            return kde + gio + xdg
-        if preferred == "gio":
-            return gio + kde + xdg
-        if preferred == "xdg":
-            return xdg + kde + gio
-        return kde + gio + xdg
-
     def _open_with_index(self, index) -> None:
         source_index = self._proxy.mapToSource(index)
         if not source_index.isValid():
@@ -974,22 +1093,28 @@ class MainWindow(QMainWindow):
             self._go_to(Path(path))
             return
         path = self._model.filePath(source_index)
-        app_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open With",
-            str(Path.home()),
-            "Applications (*)",
-        )
-        if not app_path:
+        dialog = self._open_with_file_dialog()
+        if dialog.exec() != QDialog.Accepted:
             return
+        selected = dialog.selectedFiles()
+        if not selected:
+            return
+        app_path = selected[0]
         if self._open_with_app(path, app_path):
             self._config.set("last_open_with_app", app_path)
+            self._schedule_config_save()
+
+    def _open_with_file_dialog(self) -> QFileDialog:
+        if self._open_with_dialog is None:
+            self._open_with_dialog = QFileDialog(self, "Open With", str(Path.home()), "Applications (*)")
+            self._open_with_dialog.setFileMode(QFileDialog.ExistingFile)
+        return self._open_with_dialog
 
     def _open_with_last(self, index) -> None:
         source_index = self._proxy.mapToSource(index)
         if not source_index.isValid():
             return
-        if not self._config.get_bool("enable_open_with_last", True):
+        if not self._open_with_last_enabled:
             return
         if self._model.isDir(source_index):
             path = self._model.filePath(source_index)
@@ -1031,25 +1156,29 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def _create_new_folder(self) -> None:
-        base = Path(self._current_path)
+        base = self._current_path_obj
         if not base.exists():
             return
         stem = "New Folder"
         candidate = base / stem
-        counter = 1
-        while candidate.exists():
-            candidate = base / f"{stem} {counter}"
-            counter += 1
+        if candidate.exists():
+            existing = self._existing_names(base)
+            counter = 1
+            name = f"{stem} {counter}"
+            while name in existing:
+                counter += 1
+                name = f"{stem} {counter}"
+            candidate = base / name
         try:
             candidate.mkdir()
             self._op_log.append("create_folder", [str(candidate)], success=True)
-            self._go_to(base)
+            self._request_refresh()
         except OSError as exc:
             self._op_log.append("create_folder", [str(candidate)], success=False, error=str(exc))
             show_error(self, "New Folder", str(exc))
 
     def _create_new_file(self) -> None:
-        base = Path(self._current_path)
+        base = self._current_path_obj
         if not base.exists():
             return
         candidate = self._resolve_collision(base / "New File.txt")
@@ -1057,7 +1186,7 @@ class MainWindow(QMainWindow):
             candidate.touch(exist_ok=False)
             self._op_log.append("create_file", [str(candidate)], success=True)
             self.statusBar().showMessage(f"Created {candidate.name}")
-            self._go_to(base)
+            self._request_refresh()
         except OSError as exc:
             self._op_log.append("create_file", [str(candidate)], success=False, error=str(exc))
             show_error(self, "New File", str(exc))
@@ -1076,19 +1205,31 @@ class MainWindow(QMainWindow):
             )
             if reply != QMessageBox.Yes:
                 return
-        try:
-            for entry in trash_files.iterdir():
-                if entry.is_dir() and not entry.is_symlink():
-                    shutil.rmtree(entry)
-                else:
-                    entry.unlink(missing_ok=True)
-            if trash_info.exists():
-                for entry in trash_info.iterdir():
-                    entry.unlink(missing_ok=True)
+        if self._active_trash_worker is not None:
+            return
+        dialog = OperationProgressDialog(self)
+        dialog.setWindowTitle("Empty Trash")
+        worker = EmptyTrashWorker(trash_files, trash_info)
+
+        worker.signals.current.connect(dialog.set_current_file)
+        worker.signals.progress.connect(dialog.set_progress)
+        worker.signals.error.connect(partial(show_error, self, "Empty Trash"))
+        worker.signals.finished.connect(self._on_empty_trash_finished)
+        dialog.canceled.connect(worker.cancel)
+
+        self._active_trash_worker = worker
+        self._active_trash_progress = dialog
+        dialog.show()
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_empty_trash_finished(self, completed: bool) -> None:
+        self._active_trash_worker = None
+        if self._active_trash_progress is not None:
+            self._active_trash_progress.close()
+            self._active_trash_progress = None
+        if completed:
             self.statusBar().showMessage("Trash emptied")
-            self._go_to(Path(self._current_path))
-        except OSError as exc:
-            show_error(self, "Empty Trash", str(exc))
+        self._request_refresh()
 
     def _move_to_trash_selection(self) -> None:
         paths = self._selected_source_paths()
@@ -1106,30 +1247,14 @@ class MainWindow(QMainWindow):
             return
 
         timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        moved = 0
-        for src in paths:
-            source_path = Path(src)
-            if not source_path.exists():
-                continue
-            name = self._unique_trash_name(files_dir, source_path.name)
-            dest_path = files_dir / name
-            info_path = info_dir / f"{name}.trashinfo"
-            try:
-                shutil.move(str(source_path), str(dest_path))
-                encoded = quote(str(source_path), safe="/")
-                if self._trash_delete_info:
-                    info_path.write_text(
-                        f"[Trash Info]\nPath={encoded}\nDeletionDate={timestamp}\n",
-                        encoding="utf-8",
-                    )
-                moved += 1
-            except OSError as exc:
-                show_error(self, "Move to Trash", str(exc))
-
-        if moved:
-            self._op_log.append("trash", paths, success=True)
-            self.statusBar().showMessage(f"Moved {moved} items to Trash")
-            self._go_to(Path(self._current_path))
+        operation = partial(
+            move_to_trash,
+            files_dir=files_dir,
+            info_dir=info_dir,
+            deletion_date=timestamp,
+            write_info=self._trash_delete_info,
+        )
+        self._start_file_op("Move to Trash", "trash", paths, operation)
 
     def _handle_delete_action(self) -> None:
         if self._delete_behavior == "delete":
@@ -1147,33 +1272,17 @@ class MainWindow(QMainWindow):
         if not selected:
             return
         info_dir = Path(self._trash_path).parent / "info"
-        restored = 0
-        sources: list[str] = []
-        destinations: list[str] = []
-        for src in selected:
-            source_path = Path(src)
-            info_path = info_dir / f"{source_path.name}.trashinfo"
-            info = parse_trash_info(info_path)
-            if info is None:
-                continue
-            target = info.original_path
-            target_parent = target.parent
-            if not target_parent.exists():
-                target_parent.mkdir(parents=True, exist_ok=True)
-            if target.exists():
-                target = self._resolve_collision(target)
-            try:
-                shutil.move(str(source_path), str(target))
-                info_path.unlink(missing_ok=True)
-                restored += 1
-                sources.append(str(source_path))
-                destinations.append(str(target))
-            except OSError as exc:
-                show_error(self, "Restore from Trash", str(exc))
-        if restored:
-            self._op_log.append("restore", sources, destinations, success=True)
-            self.statusBar().showMessage(f"Restored {restored} items")
-            self._go_to(Path(self._current_path))
+        info_names = self._existing_names(info_dir)
+        restorable = [path for path in selected if f"{Path(path).name}.trashinfo" in info_names]
+        if not restorable:
+            self.statusBar().showMessage("No trash metadata for the selected items")
+            return
+        self._start_file_op(
+            "Restore from Trash",
+            "restore",
+            restorable,
+            partial(restore_from_trash, info_dir=info_dir, resolve_collision=self._resolve_collision),
+        )
 
     def _confirm_permanent_delete(self) -> None:
         paths = self._selected_source_paths()
@@ -1194,47 +1303,87 @@ class MainWindow(QMainWindow):
         self._permanently_delete(paths)
 
     def _permanently_delete(self, paths: list[str]) -> None:
-        deleted = 0
-        for src in paths:
-            source_path = Path(src)
-            if not source_path.exists():
-                continue
-            try:
-                if source_path.is_dir():
-                    shutil.rmtree(source_path)
-                else:
-                    source_path.unlink()
-                deleted += 1
-            except OSError as exc:
-                show_error(self, "Permanent Delete", str(exc))
-                self._op_log.append("delete", [str(source_path)], success=False, error=str(exc))
-        if deleted:
-            self._op_log.append("delete", paths, success=True)
-            self.statusBar().showMessage(f"Deleted {deleted} items")
-            self._go_to(Path(self._current_path))
+        self._start_file_op("Permanent Delete", "delete", paths, remove_path)
+
+    def _start_file_op(
+        self, title: str, action: str, paths: list[str], operation: Callable[[Path], str]
+    ) -> None:
+        if self._active_file_op is not None:
+            self.statusBar().showMessage("Another file operation is in progress")
+            return
+        dialog = OperationProgressDialog(self)
+        dialog.setWindowTitle(title)
+        worker = FileOpWorker(paths, operation)
+
+        worker.signals.current.connect(dialog.set_current_file)
+        worker.signals.progress.connect(dialog.set_progress)
+        worker.signals.error.connect(partial(show_error, self, title))
+        worker.signals.itemResult.connect(self._on_file_op_item)
+        worker.signals.finished.connect(self._on_file_op_finished)
+        dialog.canceled.connect(worker.cancel)
+
+        self._active_file_op = worker
+        self._active_file_op_progress = dialog
+        self._file_op_action = action
+        self._file_op_sources = []
+        self._file_op_destinations = []
+        dialog.show()
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_file_op_item(self, source: str, dest: str, success: bool, error: str) -> None:
+        if success:
+            self._file_op_sources.append(source)
+            self._file_op_destinations.append(dest)
+        elif self._file_op_action == "delete":
+            self._op_log.append("delete", [source], success=False, error=error)
+
+    def _on_file_op_finished(self) -> None:
+        self._active_file_op = None
+        if self._active_file_op_progress is not None:
+            self._active_file_op_progress.close()
+            self._active_file_op_progress = None
+        sources = self._file_op_sources
+        destinations = self._file_op_destinations
+        self._file_op_sources = []
+        self._file_op_destinations = []
+        if not sources:
+            return
+        if self._file_op_action == "restore":
+            self._op_log.append("restore", sources, destinations, success=True)
+            self.statusBar().showMessage(f"Restored {len(sources)} items")
+        elif self._file_op_action == "trash":
+            self._op_log.append("trash", sources, success=True)
+            self.statusBar().showMessage(f"Moved {len(sources)} items to Trash")
+        else:
+            self._op_log.append("delete", sources, success=True)
+            self.statusBar().showMessage(f"Deleted {len(sources)} items")
+        self._request_refresh()
 
     def _selected_source_paths(self) -> list[str]:
         selection_model = self._file_views.active_view.selectionModel()
         if selection_model is None:
             return []
-        indexes = selection_model.selectedIndexes()
-        if not indexes:
-            return []
-        paths: list[str] = []
-        seen: set[str] = set()
-        for index in indexes:
-            primary = index.siblingAtColumn(0)
-            if not primary.isValid():
-                continue
-            source_primary = self._proxy.mapToSource(primary)
-            if not source_primary.isValid():
-                continue
-            path = self._model.filePath(source_primary)
-            if path in seen:
-                continue
-            seen.add(path)
-            paths.append(path)
-        return paths
+        file_path = self._model.filePath
+        sources = map(self._proxy.mapToSource, self._selected_primary_indexes(selection_model))
+        return list(dict.fromkeys(file_path(source) for source in sources if source.isValid()))
+
+    @staticmethod
+    def _selected_primary_indexes(selection_model) -> list[QModelIndex]:
+        # Walk the selection ranges row by row in column 0 rather than
+        # materialising an index for every selected cell.
+        primaries: list[QModelIndex] = []
+        seen_rows: set[int] = set()
+        for selection_range in selection_model.selection():
+            model = selection_range.model()
+            parent = selection_range.parent()
+            for row in range(selection_range.top(), selection_range.bottom() + 1):
+                if row in seen_rows:
+                    continue
+                seen_rows.add(row)
+                primary = model.index(row, 0, parent)
+                if primary.isValid():
+                    primaries.append(primary)
+        return primaries
 
     def _select_all(self) -> None:
         view = self._file_views.active_view
@@ -1265,7 +1414,7 @@ class MainWindow(QMainWindow):
         if not self._clipboard_paths or not self._clipboard_mode:
             self.statusBar().showMessage("Clipboard empty")
             return
-        target_dir = Path(self._current_path)
+        target_dir = self._current_path_obj
         if not target_dir.exists():
             self.statusBar().showMessage("No valid destination for paste")
             return
@@ -1279,9 +1428,9 @@ class MainWindow(QMainWindow):
         worker.signals.current.connect(dialog.set_current_file)
         worker.signals.progress.connect(dialog.set_progress)
         worker.signals.meta.connect(dialog.set_meta)
-        worker.signals.error.connect(lambda message: show_error(self, "Paste", message))
+        worker.signals.error.connect(partial(show_error, self, "Paste"))
         worker.signals.finished.connect(dialog.close)
-        worker.signals.finished.connect(lambda: self._on_transfer_finished(target_dir))
+        worker.signals.finished.connect(partial(self._on_transfer_finished, target_dir))
         dialog.canceled.connect(worker.cancel)
         worker.signals.itemResult.connect(self._log_transfer_item)
 
@@ -1299,7 +1448,10 @@ class MainWindow(QMainWindow):
         if self._active_progress is not None:
             self._active_progress.close()
             self._active_progress = None
-        self._go_to(target_dir)
+        if str(target_dir) == self._current_path:
+            self._request_refresh()
+        else:
+            self._go_to(target_dir)
 
     def _log_transfer_item(self, source: str, dest: str, mode: str, success: bool, error: str) -> None:
         action = "copy" if mode == "copy" else "move"
@@ -1310,18 +1462,27 @@ class MainWindow(QMainWindow):
             return
         self._op_log.append("rename", [source], [dest], success=success, error=error)
 
+    @staticmethod
+    def _resolve_dir(path: Path) -> Path | None:
+        try:
+            return path.resolve()
+        except OSError:
+            return None
+
     def _build_transfer_items(self, paths: list[str], target_dir: Path, mode: str) -> list[TransferItem]:
         items: list[TransferItem] = []
         apply_action: str | None = None
+        resolved_parents: dict[Path, Path | None] = {}
+        resolved_target = self._resolve_dir(target_dir)
         for src in paths:
             source_path = Path(src)
             if not source_path.exists():
                 continue
             dest = target_dir / source_path.name
-            try:
-                same_target = source_path.resolve() == dest.resolve()
-            except OSError:
-                same_target = False
+            parent = source_path.parent
+            if parent not in resolved_parents:
+                resolved_parents[parent] = self._resolve_dir(parent)
+            same_target = resolved_target is not None and resolved_parents[parent] == resolved_target
             if same_target:
                 if mode == "copy":
                     dest = self._resolve_collision(dest)
@@ -1365,39 +1526,40 @@ class MainWindow(QMainWindow):
     def _resolve_collision(path: Path) -> Path:
         if not path.exists():
             return path
+        existing = MainWindow._existing_names(path.parent)
         stem = path.stem
         suffix = path.suffix
         counter = 1
-        candidate = path
-        while candidate.exists():
-            candidate = path.with_name(f"{stem} ({counter}){suffix}")
+        name = f"{stem} ({counter}){suffix}"
+        while name in existing:
             counter += 1
-        return candidate
+            name = f"{stem} ({counter}){suffix}"
+        return path.with_name(name)
 
     @staticmethod
-    def _unique_trash_name(base: Path, name: str) -> str:
-        candidate = name
-        counter = 1
-        while (base / candidate).exists():
-            candidate = f"{name} {counter}"
-            counter += 1
-        return candidate
+    def _existing_names(directory: Path) -> set[str]:
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
 
-    def _apply_filter(self, text: str) -> None:
-        if not text:
-            self._proxy.setFilterRegularExpression(QRegularExpression())
-            self._update_empty_state()
+    def _schedule_filter(self, text: str) -> None:
+        if text:
+            self._filter_timer.start()
             return
-        escaped = QRegularExpression.escape(text)
-        regex = QRegularExpression(escaped, QRegularExpression.CaseInsensitiveOption)
-        self._proxy.setFilterRegularExpression(regex)
+        self._filter_timer.stop()
+        self._apply_filter()
+
+    def _apply_filter(self) -> None:
+        self._proxy.setFilterRegularExpression(_filter_regex(self._search_edit.text()))
         self._update_empty_state()
 
     def _open_quick_filters(self) -> None:
         query = self._search_edit.text().strip()
         local_result = translate_query(query, allow_ai=False)
         result = local_result
-        if self._config.get_bool("ai_enabled", False):
+        if self._ai_enabled:
             payload = {"query": query, "local": local_result}
             dialog = AIDataPreviewDialog(
                 "AI Filter Preview",
@@ -1479,6 +1641,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(header)
 
         self._inline_search_results = QListWidget()
+        self._inline_search_results.setUniformItemSizes(True)
         self._inline_search_results.setContextMenuPolicy(Qt.CustomContextMenu)
         layout.addWidget(self._inline_search_results)
 
@@ -1595,25 +1758,45 @@ class MainWindow(QMainWindow):
         filters.addWidget(self._activity_name_filter, 1)
         layout.addLayout(filters)
 
-        self._activity_list = QTreeWidget()
-        self._activity_list.setHeaderLabels(["When", "Action", "Item", "Destination", "Status"])
+        self._activity_model = ActivityModel(self)
+        self._activity_list = QTreeView()
+        self._activity_list.setModel(self._activity_model)
         self._activity_list.setRootIsDecorated(False)
         self._activity_list.setUniformRowHeights(True)
         self._activity_list.setSelectionMode(QAbstractItemView.SingleSelection)
         self._activity_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        # Size the bounded columns from sample text once; ResizeToContents
+        # would re-measure every row after each model reset.
+        metrics = self._activity_list.fontMetrics()
+        padding = 24
+        activity_header = self._activity_list.header()
+        activity_header.setStretchLastSection(False)
+        activity_header.setSectionResizeMode(0, QHeaderView.Fixed)
+        activity_header.setSectionResizeMode(1, QHeaderView.Fixed)
+        activity_header.setSectionResizeMode(2, QHeaderView.Stretch)
+        activity_header.setSectionResizeMode(3, QHeaderView.Stretch)
+        activity_header.setSectionResizeMode(4, QHeaderView.Fixed)
+        activity_header.resizeSection(0, metrics.horizontalAdvance("0000-00-00 00:00") + padding)
+        activity_header.resizeSection(1, metrics.horizontalAdvance("Create Folder") + padding)
+        activity_header.resizeSection(4, metrics.horizontalAdvance("Failed") + padding)
         layout.addWidget(self._activity_list, 1)
 
         self._activity_status = QLabel("Ready")
         self._activity_status.setObjectName("ActivityStatus")
         layout.addWidget(self._activity_status)
 
+        self._activity_refresh_timer = QTimer(self)
+        self._activity_refresh_timer.setSingleShot(True)
+        self._activity_refresh_timer.setInterval(_FILTER_DELAY_MS)
+        self._activity_refresh_timer.timeout.connect(self._refresh_activity)
+
         self._activity_refresh.clicked.connect(self._refresh_activity)
-        self._activity_close.clicked.connect(lambda: self._toggle_activity_panel(False))
+        self._activity_close.clicked.connect(self._hide_activity_panel)
         self._activity_action_filter.currentIndexChanged.connect(self._refresh_activity)
         self._activity_time_filter.currentIndexChanged.connect(self._refresh_activity)
         self._activity_scope_filter.currentIndexChanged.connect(self._refresh_activity)
-        self._activity_name_filter.textChanged.connect(self._refresh_activity)
-        self._activity_list.itemDoubleClicked.connect(self._reveal_activity_entry)
+        self._activity_name_filter.textChanged.connect(self._activity_refresh_timer.start)
+        self._activity_list.doubleClicked.connect(self._reveal_activity_entry)
         self._activity_list.customContextMenuRequested.connect(self._activity_context_menu)
         return panel
 
@@ -1638,17 +1821,25 @@ class MainWindow(QMainWindow):
         self._working_set_id = set_id
         self._working_set_label.setText(f"Working Set: {work_set.name}")
         self._working_set_indicator.setVisible(True)
-        self._working_set_list.clear()
         missing = 0
-        for item in work_set.items:
-            text = item.path
-            if not item.exists:
-                text = f"{item.path} (missing)"
-                missing += 1
-            entry = QListWidgetItem(text)
-            entry.setData(Qt.UserRole, item.path)
-            entry.setData(Qt.UserRole + 1, bool(item.exists))
-            self._working_set_list.addItem(entry)
+        self._working_set_list.setUpdatesEnabled(False)
+        self._working_set_list.blockSignals(True)
+        try:
+            self._working_set_list.clear()
+            self._working_set_path_index = {}
+            for item in work_set.items:
+                text = item.path
+                if not item.exists:
+                    text = f"{item.path} (missing)"
+                    missing += 1
+                entry = QListWidgetItem(text)
+                entry.setData(Qt.UserRole, item.path)
+                entry.setData(Qt.UserRole + 1, bool(item.exists))
+                self._working_set_list.addItem(entry)
+                self._working_set_path_index[os.path.normpath(item.path)] = entry
+        finally:
+            self._working_set_list.blockSignals(False)
+            self._working_set_list.setUpdatesEnabled(True)
         self._working_set_status.setText(
             f"{len(work_set.items)} items, {missing} missing" if work_set.items else "Empty"
         )
@@ -1667,8 +1858,11 @@ class MainWindow(QMainWindow):
         if show:
             self._refresh_activity()
 
+    def _hide_activity_panel(self) -> None:
+        self._toggle_activity_panel(False)
+
     def _refresh_activity(self) -> None:
-        entries = self._op_log.iter_entries()
+        self._activity_refresh_timer.stop()
         action_filter = self._activity_action_filter.currentData()
         name_filter = self._activity_name_filter.text().strip().lower()
         cutoff_seconds = int(self._activity_time_filter.currentData() or 0)
@@ -1677,39 +1871,39 @@ class MainWindow(QMainWindow):
         if cutoff_seconds:
             cutoff = datetime.utcnow() - timedelta(seconds=cutoff_seconds)
 
-        self._activity_list.clear()
-        filtered = 0
-        working_set_paths: list[str] = []
+        anchors: frozenset[str] = frozenset()
         if scope_filter == "working_set":
-            working_set_paths = self._current_working_set_paths()
-            if not working_set_paths:
-                self._activity_status.setText("No working set selected")
-                return
-        for entry in reversed(entries):
-            if working_set_paths and not self._entry_matches_working_set(entry, working_set_paths):
-                continue
-            action = str(entry.get("action", "")).lower()
-            if action_filter and action_filter != "all" and action != action_filter:
-                continue
-            timestamp_text = str(entry.get("timestamp", "")).strip()
-            if cutoff:
-                try:
-                    timestamp = datetime.fromisoformat(timestamp_text)
-                except ValueError:
-                    continue
-                if timestamp < cutoff:
-                    continue
-            if name_filter and not self._entry_matches_name(entry, name_filter):
-                continue
-            item = self._build_activity_item(entry)
-            if item is None:
-                continue
-            self._activity_list.addTopLevelItem(item)
-            filtered += 1
-        self._activity_status.setText(f"{filtered} entries")
-        self._activity_list.resizeColumnToContents(0)
-        self._activity_list.resizeColumnToContents(1)
-        self._activity_list.resizeColumnToContents(4)
+            anchors = working_set_anchors(self._current_working_set_paths())
+        self._activity_request += 1
+        if self._activity_worker is not None:
+            self._activity_worker.cancel()
+            self._activity_worker = None
+        if scope_filter == "working_set" and not anchors:
+            self._activity_model.set_entries([])
+            self._activity_status.setText("No working set selected")
+            return
+        worker = ActivityFilterWorker(
+            self._op_log,
+            self._activity_request,
+            action_filter,
+            name_filter,
+            cutoff,
+            anchors,
+            _ACTIVITY_ROW_LIMIT,
+        )
+        worker.signals.finished.connect(self._on_activity_filtered)
+        self._activity_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_activity_filtered(self, request_id: int, entries: list, capped: bool) -> None:
+        if request_id != self._activity_request:
+            return
+        self._activity_worker = None
+        self._activity_model.set_entries(entries)
+        if capped:
+            self._activity_status.setText(f"Showing latest {len(entries)} entries")
+        else:
+            self._activity_status.setText(f"{len(entries)} entries")
 
     def _update_activity_scope_state(self) -> None:
         has_working_set = bool(self._working_set_id and self._current_working_set_paths())
@@ -1725,48 +1919,28 @@ class MainWindow(QMainWindow):
             return []
         return [item.path for item in work_set.items if item.path]
 
-    def _entry_matches_working_set(self, entry: dict, paths: list[str]) -> bool:
-        if not paths:
-            return False
-        normalized = [os.path.normpath(path) for path in paths if path]
-        entry_paths = entry.get("sources", []) + entry.get("destinations", [])
-        for path in entry_paths:
-            if not path:
-                continue
-            entry_norm = os.path.normpath(path)
-            for anchor in normalized:
-                if not anchor:
-                    continue
-                if anchor == os.sep:
-                    return True
-                if entry_norm == anchor or entry_norm.startswith(anchor + os.sep):
-                    return True
-        return False
-
     def _working_set_activity_summary(self, paths: list[str]) -> str:
         if not paths:
             return ""
+        anchors = working_set_anchors(paths)
         cutoff = datetime.utcnow() - timedelta(days=7)
-        entries = self._op_log.iter_entries()
         count = 0
         latest: datetime | None = None
-        for entry in entries:
-            if not self._entry_matches_working_set(entry, paths):
-                continue
-            timestamp_text = str(entry.get("timestamp", "")).strip()
-            try:
-                timestamp = datetime.fromisoformat(timestamp_text)
-            except ValueError:
+        # The log is append-only, so reading it newest-first lets us stop at
+        # the first entry older than the cutoff.
+        for entry in self._op_log.iter_entries_reversed():
+            timestamp = parse_timestamp(str(entry.get("timestamp", "")))
+            if timestamp is None:
                 continue
             if timestamp < cutoff:
+                break
+            if not entry_matches_working_set(entry, anchors):
                 continue
             count += 1
-            if latest is None or timestamp > latest:
+            if latest is None:
                 latest = timestamp
-        if count == 0:
-            return "No recent activity"
         if latest is None:
-            return f"{count} recent actions"
+            return "No recent activity"
         return f"{count} recent actions (last {self._format_relative_time(latest)} ago)"
 
     @staticmethod
@@ -1782,65 +1956,36 @@ class MainWindow(QMainWindow):
             return f"{hours}h"
         days = int(delta // 86400)
         return f"{days}d"
-    def _entry_matches_name(self, entry: dict, fragment: str) -> bool:
-        for path in entry.get("sources", []) + entry.get("destinations", []):
-            name = Path(path).name.lower()
-            if fragment in name:
-                return True
-        return False
 
-    def _build_activity_item(self, entry: dict) -> QTreeWidgetItem | None:
-        timestamp_text = str(entry.get("timestamp", "")).strip()
-        try:
-            timestamp = datetime.fromisoformat(timestamp_text)
-            when_label = timestamp.strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            when_label = timestamp_text or "Unknown"
-        action = str(entry.get("action", "")).replace("_", " ").title()
-        sources = entry.get("sources", [])
-        destinations = entry.get("destinations", [])
-        source_label = self._summarize_paths(sources)
-        dest_label = self._summarize_paths(destinations)
-        success = bool(entry.get("success", True))
-        status = "OK" if success else "Failed"
-        item = QTreeWidgetItem([when_label, action, source_label, dest_label, status])
-        item.setData(0, Qt.UserRole, entry)
-        if sources:
-            item.setToolTip(2, "\n".join(sources))
-        if destinations:
-            item.setToolTip(3, "\n".join(destinations))
-        if not success and entry.get("error"):
-            item.setToolTip(4, str(entry.get("error")))
-        return item
+    def _activity_context_menu(self, position) -> None:
+        index = self._activity_list.indexAt(position)
+        if not index.isValid():
+            return
+        self._activity_list.setCurrentIndex(index)
+        if self._activity_menu is None:
+            self._activity_menu = QMenu(self)
+            reveal_action = self._activity_menu.addAction("Reveal in Folder")
+            reveal_action.triggered.connect(self._reveal_current_activity_entry)
+            working_sets_menu = self._activity_menu.addMenu("Working Sets")
+            working_sets_menu.aboutToShow.connect(
+                partial(self._populate_activity_working_sets_menu, working_sets_menu)
+            )
+        self._activity_menu.popup(self._activity_list.viewport().mapToGlobal(position))
 
-    @staticmethod
-    def _summarize_paths(paths: list[str]) -> str:
-        if not paths:
-            return ""
-        first = Path(paths[0]).name
-        if len(paths) == 1:
-            return first
-        return f"{first} (+{len(paths) - 1})"
+    def _reveal_current_activity_entry(self) -> None:
+        self._reveal_activity_entry(self._activity_list.currentIndex())
 
-    def _activity_context_menu(self, position) -> None:
-        item = self._activity_list.itemAt(position)
-        if item is None:
+    def _populate_activity_working_sets_menu(self, menu: QMenu) -> None:
+        menu.clear()
+        index = self._activity_list.currentIndex()
+        entry = self._activity_model.entry(index.row()) if index.isValid() else None
+        if entry is None:
             return
-        menu = QMenu(self)
-        reveal_action = menu.addAction("Reveal in Folder")
-        reveal_action.triggered.connect(lambda: self._reveal_activity_entry(item))
-        working_sets_menu = menu.addMenu("Working Sets")
-        self._populate_activity_working_sets_menu(working_sets_menu, item)
-        menu.exec(self._activity_list.viewport().mapToGlobal(position))
-
-    def _populate_activity_working_sets_menu(self, menu: QMenu, item: QTreeWidgetItem) -> None:
-        entry = item.data(0, Qt.UserRole) or {}
         candidates: list[str] = []
         for path in entry.get("destinations", []) + entry.get("sources", []):
             if path and path not in candidates:
                 candidates.append(path)
-        related = self._working_sets_for_paths(candidates)
-        menu.clear()
+        related = self._working_sets.sets_for_paths(candidates)
         if not related:
             empty = menu.addAction("No matching working sets")
             empty.setEnabled(False)
@@ -1848,21 +1993,7 @@ class MainWindow(QMainWindow):
         target = candidates[0] if candidates else ""
         for set_id, name in related:
             action = menu.addAction(f"Open {name}")
-            action.triggered.connect(
-                lambda _, sid=set_id, path=target: self._open_working_set_from_activity(sid, path)
-            )
-
-    def _working_sets_for_paths(self, paths: list[str]) -> list[tuple[str, str]]:
-        if not paths:
-            return []
-        normalized = {os.path.normpath(path) for path in paths if path}
-        related: list[tuple[str, str]] = []
-        for work_set in self._working_sets.list_sets():
-            for item in work_set.items:
-                if os.path.normpath(item.path) in normalized:
-                    related.append((work_set.id, work_set.name))
-                    break
-        return related
+            action.triggered.connect(partial(self._open_working_set_from_activity, set_id, target))
 
     def _open_working_set_from_activity(self, set_id: str, path: str) -> None:
         self._open_working_set(set_id)
@@ -1872,44 +2003,36 @@ class MainWindow(QMainWindow):
     def _select_working_set_item(self, path: str) -> None:
         if not path:
             return
-        for i in range(self._working_set_list.count()):
-            item = self._working_set_list.item(i)
-            if item is None:
-                continue
-            item_path = item.data(Qt.UserRole)
-            if not item_path:
-                continue
-            if os.path.normpath(str(item_path)) == os.path.normpath(path):
-                self._working_set_list.setCurrentItem(item)
-                self._working_set_list.scrollToItem(item)
-                return
+        item = self._working_set_path_index.get(os.path.normpath(path))
+        if item is not None:
+            self._working_set_list.setCurrentItem(item)
+            self._working_set_list.scrollToItem(item)
 
-    def _reveal_activity_entry(self, item: QTreeWidgetItem | None = None) -> None:
-        if item is None:
-            item = self._activity_list.currentItem()
-        if item is None:
+    def _reveal_activity_entry(self, index: QModelIndex | None = None) -> None:
+        if index is None:
+            index = self._activity_list.currentIndex()
+        entry = self._activity_model.entry(index.row()) if index.isValid() else None
+        if entry is None:
             return
-        entry = item.data(0, Qt.UserRole) or {}
         target = self._resolve_activity_target(entry)
         if not target:
             show_error(self, "Recent Activity", "No path available.")
             return
-        target_path = Path(target)
-        if target_path.is_dir():
-            self._go_to(target_path)
+        if os.path.isdir(target):
+            self._go_to(Path(target))
             return
-        parent = target_path.parent
-        if parent.exists():
-            self._go_to(parent)
-            if target_path.exists():
-                self._select_path(str(target_path))
+        parent = os.path.dirname(target)
+        if os.path.exists(parent):
+            self._go_to(Path(parent))
+            if os.path.exists(target):
+                self._select_path(target)
 
     @staticmethod
     def _resolve_activity_target(entry: dict) -> str:
         destinations = entry.get("destinations", []) if entry.get("success", True) else []
         candidates = destinations + entry.get("sources", [])
         for path in candidates:
-            if Path(path).exists():
+            if os.path.exists(path):
                 return path
         if destinations:
             return destinations[0]
@@ -1924,6 +2047,7 @@ class MainWindow(QMainWindow):
     def _close_working_set(self) -> None:
         self._working_set_panel.setVisible(False)
         self._working_set_id = None
+        self._working_set_path_index = {}
         self._working_set_indicator.setVisible(False)
         self._update_activity_scope_state()
         self._file_views.setVisible(True)
@@ -1983,25 +2107,31 @@ class MainWindow(QMainWindow):
         path, exists = self._working_set_item_info(item)
         if not path:
             return
-        menu = QMenu(self)
-        open_action = menu.addAction("Open")
-        open_window_action = menu.addAction("Open in New Window")
-        reveal_action = menu.addAction("Reveal in Folder")
-        copy_action = menu.addAction("Copy Path")
-        properties_action = menu.addAction("Properties")
-        menu.addSeparator()
-        remove_action = menu.addAction("Remove from Working Set")
-        open_action.triggered.connect(self._open_working_set_item)
-        open_window_action.triggered.connect(self._open_working_set_in_new_window)
-        reveal_action.triggered.connect(self._reveal_selected_working_set_item)
-        copy_action.triggered.connect(self._copy_working_set_item_path)
-        properties_action.triggered.connect(self._show_working_set_item_properties)
-        remove_action.triggered.connect(self._remove_selected_from_working_set)
-        open_action.setEnabled(exists)
-        open_window_action.setEnabled(exists)
-        reveal_action.setEnabled(exists)
-        properties_action.setEnabled(exists)
-        menu.exec(self._working_set_list.viewport().mapToGlobal(position))
+        if self._working_set_menu is None:
+            menu = QMenu(self)
+            open_action = menu.addAction("Open")
+            open_window_action = menu.addAction("Open in New Window")
+            reveal_action = menu.addAction("Reveal in Folder")
+            copy_action = menu.addAction("Copy Path")
+            properties_action = menu.addAction("Properties")
+            menu.addSeparator()
+            remove_action = menu.addAction("Remove from Working Set")
+            open_action.triggered.connect(self._open_working_set_item)
+            open_window_action.triggered.connect(self._open_working_set_in_new_window)
+            reveal_action.triggered.connect(self._reveal_selected_working_set_item)
+            copy_action.triggered.connect(self._copy_working_set_item_path)
+            properties_action.triggered.connect(self._show_working_set_item_properties)
+            remove_action.triggered.connect(self._remove_selected_from_working_set)
+            self._working_set_menu = menu
+            self._working_set_existing_actions = [
+                open_action,
+                open_window_action,
+                reveal_action,
+                properties_action,
+            ]
+        for action in self._working_set_existing_actions:
+            action.setEnabled(exists)
+        self._working_set_menu.popup(self._working_set_list.viewport().mapToGlobal(position))
 
     def _working_set_item_info(self, item: QListWidgetItem) -> tuple[str, bool]:
         path = item.data(Qt.UserRole)
@@ -2046,7 +2176,7 @@ class MainWindow(QMainWindow):
         name, ok = QInputDialog.getText(self, "Rename Working Set", "Name:", text=work_set.name)
         if ok and name.strip():
             self._working_sets.rename_set(set_id, name.strip())
-            self._places.set_working_sets(self._serialize_working_sets())
+            self._request_sidebar_sync()
             if self._working_set_id == set_id:
                 self._open_working_set(set_id)
 
@@ -2063,12 +2193,26 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         self._working_sets.delete_set(set_id)
-        self._places.set_working_sets(self._serialize_working_sets())
+        self._request_sidebar_sync()
         if self._working_set_id == set_id:
             self._close_working_set()
 
+    def _request_sidebar_sync(self) -> None:
+        if self._sidebar_sync_pending:
+            return
+        self._sidebar_sync_pending = True
+        QTimer.singleShot(0, self._sync_sidebar_working_sets)
+
+    def _sync_sidebar_working_sets(self) -> None:
+        self._sidebar_sync_pending = False
+        serialized = self._serialize_working_sets()
+        if serialized == self._sidebar_working_sets:
+            return
+        self._sidebar_working_sets = serialized
+        self._places.set_working_sets(serialized)
+
     def _serialize_working_sets(self) -> list[dict]:
-        return [{"id": item.id, "name": item.name} for item in self._working_sets.list_sets()]
+        return [{"id": set_id, "name": name} for set_id, name in self._working_sets.set_names()]
 
     def _set_inline_search_mode(self, enabled: bool) -> None:
         self._file_views.setVisible(not enabled)
@@ -2088,7 +2232,7 @@ class MainWindow(QMainWindow):
         self._config.set("search_scope", "recursive" if recursive else "current")
         if label.startswith("System"):
             self._config.set("search_scope", "system")
-        self._config.save()
+        self._schedule_config_save()
 
         worker = SearchWorker(
             root,
@@ -2098,15 +2242,16 @@ class MainWindow(QMainWindow):
             recursive=recursive,
             filters=self._inline_search_filters,
         )
-        worker.signals.found.connect(self._inline_search_results.addItem)
-        worker.signals.progress.connect(
-            lambda count: self._inline_search_status.setText(f"Scanned {count} items")
-        )
-        worker.signals.error.connect(lambda message: self._inline_search_status.setText(message))
-        worker.signals.finished.connect(self._finish_inline_search)
+        worker.signals.foundBatch.connect(self._inline_search_results.addItems, Qt.QueuedConnection)
+        worker.signals.progress.connect(self._on_inline_search_progress, Qt.QueuedConnection)
+        worker.signals.error.connect(self._inline_search_status.setText, Qt.QueuedConnection)
+        worker.signals.finished.connect(self._finish_inline_search, Qt.QueuedConnection)
         self._inline_search_worker = worker
         QThreadPool.globalInstance().start(worker)
 
+    def _on_inline_search_progress(self, count: int) -> None:
+        self._inline_search_status.setText(f"Scanned {count} items")
+
     def _finish_inline_search(self) -> None:
         self._inline_search_worker = None
         self._inline_search_status.setText(f"{self._inline_search_results.count()} results")
@@ -2137,12 +2282,21 @@ class MainWindow(QMainWindow):
         item = self._inline_search_results.itemAt(position)
         if item is None:
             return
-        menu = QMenu(self)
-        reveal_action = menu.addAction("Reveal in Folder")
-        reveal_action.triggered.connect(self._reveal_inline_result)
-        add_menu = menu.addMenu("Add to Working Set")
-        self._populate_working_set_menu_for_paths(add_menu, [item.text()])
-        menu.exec(self._inline_search_results.viewport().mapToGlobal(position))
+        self._inline_search_results.setCurrentItem(item)
+        if self._inline_search_menu is None:
+            self._inline_search_menu = QMenu(self)
+            reveal_action = self._inline_search_menu.addAction("Reveal in Folder")
+            reveal_action.triggered.connect(self._reveal_inline_result)
+            add_menu = self._inline_search_menu.addMenu("Add to Working Set")
+            add_menu.aboutToShow.connect(partial(self._populate_inline_result_working_set_menu, add_menu))
+        self._inline_search_menu.popup(self._inline_search_results.viewport().mapToGlobal(position))
+
+    def _populate_inline_result_working_set_menu(self, menu: QMenu) -> None:
+        item = self._inline_search_results.currentItem()
+        if item is None:
+            menu.clear()
+            return
+        self._populate_working_set_menu_for_paths(menu, [item.text()])
 
     def _reveal_inline_result(self) -> None:
         item = self._inline_search_results.currentItem()
@@ -2151,21 +2305,20 @@ class MainWindow(QMainWindow):
         path = item.text()
         if not path:
             return
-        target = Path(path)
-        if target.is_dir():
-            self._go_to(target)
+        if os.path.isdir(path):
+            self._go_to(Path(path))
             return
-        parent = target.parent
-        if parent.exists():
-            self._go_to(parent)
-            if target.exists():
-                self._select_path(str(target))
+        parent = os.path.dirname(path)
+        if os.path.exists(parent):
+            self._go_to(Path(parent))
+            if os.path.exists(path):
+                self._select_path(path)
 
     def _open_inline_filters(self) -> None:
         query = self._inline_search_query.text().strip()
         local_result = translate_query(query, allow_ai=False)
         result = local_result
-        if self._config.get_bool("ai_enabled", False):
+        if self._ai_enabled:
             payload = {"query": query, "local": local_result}
             dialog = AIDataPreviewDialog(
                 "AI Filter Preview",
@@ -2193,41 +2346,46 @@ class MainWindow(QMainWindow):
             self._inline_search_ai.setVisible(result.get("source") == "ai")
 
     def _populate_working_set_menu(self, menu: QMenu) -> None:
+        # The actions act on the selection at trigger time, so the menu only
+        # needs rebuilding when the set names change.
+        sets = self._working_sets.set_names()
+        if menu.actions() and sets == self._working_set_menu_sets:
+            return
+        self._working_set_menu_sets = sets
         menu.clear()
-        sets = self._working_sets.list_sets()
         if not sets:
             create_action = menu.addAction("Create Working Set…")
             create_action.triggered.connect(self._create_working_set)
             return
-        for item in sets:
-            action = menu.addAction(f"Add to {item.name}")
-            action.triggered.connect(lambda _, set_id=item.id: self._add_selection_to_working_set(set_id))
+        for set_id, name in sets:
+            action = menu.addAction(f"Add to {name}")
+            action.triggered.connect(partial(self._add_selection_to_working_set, set_id))
         menu.addSeparator()
         create_action = menu.addAction("Create Working Set…")
         create_action.triggered.connect(self._create_working_set)
 
     def _populate_working_set_menu_for_paths(self, menu: QMenu, paths: list[str]) -> None:
         menu.clear()
-        sets = self._working_sets.list_sets()
+        # One copy shared by every action instead of one per working set.
+        paths = list(paths)
+        sets = self._working_sets.set_names()
         if not sets:
             create_action = menu.addAction("Create Working Set…")
-            create_action.triggered.connect(lambda: self._create_working_set_from_paths(paths))
+            create_action.triggered.connect(partial(self._create_working_set_from_paths, paths))
             return
-        for item in sets:
-            action = menu.addAction(f"Add to {item.name}")
-            action.triggered.connect(
-                lambda _, set_id=item.id, items=list(paths): self._add_paths_to_working_set(set_id, items)
-            )
+        for set_id, name in sets:
+            action = menu.addAction(f"Add to {name}")
+            action.triggered.connect(partial(self._add_paths_to_working_set, set_id, paths))
         menu.addSeparator()
         create_action = menu.addAction("Create Working Set…")
-        create_action.triggered.connect(lambda: self._create_working_set_from_paths(paths))
+        create_action.triggered.connect(partial(self._create_working_set_from_paths, paths))
 
     def _create_working_set(self) -> None:
         name, ok = QInputDialog.getText(self, "New Working Set", "Name:")
         if not ok or not name.strip():
             return
         new_set = self._working_sets.create_set(name.strip())
-        self._places.set_working_sets(self._serialize_working_sets())
+        self._request_sidebar_sync()
         self._add_selection_to_working_set(new_set.id)
 
     def _create_working_set_from_paths(self, paths: list[str]) -> None:
@@ -2235,7 +2393,7 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
         new_set = self._working_sets.create_set(name.strip())
-        self._places.set_working_sets(self._serialize_working_sets())
+        self._request_sidebar_sync()
         self._add_paths_to_working_set(new_set.id, paths)
 
     def _add_selection_to_working_set(self, set_id: str) -> None:
@@ -2243,13 +2401,13 @@ class MainWindow(QMainWindow):
         if not paths:
             return
         self._working_sets.add_items(set_id, paths)
-        self._places.set_working_sets(self._serialize_working_sets())
+        self._request_sidebar_sync()
 
     def _add_paths_to_working_set(self, set_id: str, paths: list[str]) -> None:
         if not paths:
             return
         self._working_sets.add_items(set_id, paths)
-        self._places.set_working_sets(self._serialize_working_sets())
+        self._request_sidebar_sync()
         if self._working_set_id == set_id:
             self._open_working_set(set_id)
 
@@ -2261,13 +2419,13 @@ class MainWindow(QMainWindow):
             return 2
         return 0
 
-    def _resolve_inline_scope(self) -> tuple[Path, bool, str]:
+    def _resolve_inline_scope(self) -> tuple[str, bool, str]:
         index = self._inline_search_scope.currentIndex()
         if index == 1:
-            return Path(self._current_path), True, "This Folder + Subfolders"
+            return self._current_path, True, "This Folder + Subfolders"
         if index == 2:
-            return Path("/"), True, "System (All Files)"
-        return Path(self._current_path), False, "Current Folder"
+            return "/", True, "System (All Files)"
+        return self._current_path, False, "Current Folder"
 
     def _open_folder_summary_index(self, index) -> None:
         source_index = self._proxy.mapToSource(index)
@@ -2295,35 +2453,54 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def _apply_rename_suggestions(self, renames: list[tuple[str, str]]) -> None:
-        renamed = 0
+        # One directory listing per parent replaces two stats per rename.
+        listings: dict[str, set[str]] = {}
+        renamed_sources: list[str] = []
+        renamed_targets: list[str] = []
+        failed_sources: list[str] = []
+        failed_targets: list[str] = []
+        errors: list[str] = []
         for src, new_name in renames:
             if not src or not new_name:
                 continue
-            source_path = Path(src)
-            if not source_path.exists():
+            parent, name = os.path.split(src)
+            existing = listings.get(parent)
+            if existing is None:
+                existing = listings[parent] = self._existing_names(Path(parent))
+            if name not in existing:
                 continue
             if os.sep in new_name or (os.altsep and os.altsep in new_name):
                 show_error(self, "Rename Suggestions", f"Invalid name: {new_name}")
                 continue
-            target = source_path.with_name(new_name)
-            if target == source_path:
+            if new_name == name:
                 continue
-            if target.exists():
+            if new_name in existing:
                 show_error(self, "Rename Suggestions", f"Target exists: {new_name}")
                 continue
+            target = os.path.join(parent, new_name)
             try:
-                source_path.rename(target)
-                self._op_log.append("rename", [str(source_path)], [str(target)], success=True)
-                renamed += 1
+                os.rename(src, target)
             except OSError as exc:
-                self._op_log.append("rename", [str(source_path)], [str(target)], success=False, error=str(exc))
+                failed_sources.append(src)
+                failed_targets.append(target)
+                errors.append(str(exc))
                 show_error(self, "Rename Suggestions", str(exc))
-        if renamed:
-            self.statusBar().showMessage(f"Renamed {renamed} items")
-            self._go_to(Path(self._current_path))
+                continue
+            existing.discard(name)
+            existing.add(new_name)
+            renamed_sources.append(src)
+            renamed_targets.append(target)
+        if failed_sources:
+            self._op_log.append(
+                "rename", failed_sources, failed_targets, success=False, error="; ".join(errors)
+            )
+        if renamed_sources:
+            self._op_log.append("rename", renamed_sources, renamed_targets, success=True)
+            self.statusBar().showMessage(f"Renamed {len(renamed_sources)} items")
+            self._request_refresh()
 
     def _open_image_generation(self, index=None, mode: str = "new") -> None:
-        if not self._config.get_bool("ai_enabled", False):
+        if not self._ai_enabled:
             show_error(self, "Generate Image", "Enable AI features to use image generation.")
             return
         folder = self._current_path
@@ -2355,16 +2532,14 @@ class MainWindow(QMainWindow):
         progress = OperationProgressDialog(self)
         progress.setWindowTitle("Image Generation")
         progress.set_current_file("Generating image")
-        progress.set_progress(0)
         progress.set_meta("Starting...")
 
         worker = ImageGenerationWorker(mode=mode, payload=payload)
         worker.signals.current.connect(progress.set_current_file)
         worker.signals.progress.connect(progress.set_progress)
         worker.signals.meta.connect(progress.set_meta)
-        worker.signals.error.connect(lambda message: show_error(self, "Generate Image", message))
+        worker.signals.error.connect(partial(show_error, self, "Generate Image"))
         worker.signals.finished.connect(self._on_image_generation_finished)
-        worker.signals.finished.connect(progress.close)
         progress.canceled.connect(worker.cancel)
 
         self._active_image_worker = worker
@@ -2375,9 +2550,8 @@ class MainWindow(QMainWindow):
     def _is_image_index(self, source_index) -> bool:
         if not source_index.isValid() or self._model.isDir(source_index):
             return False
-        path = self._model.filePath(source_index)
-        suffix = Path(path).suffix.lower()
-        return suffix in {".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".tif", ".tiff"}
+        stem, _, suffix = self._model.fileName(source_index).rpartition(".")
+        return bool(stem) and suffix.lower() in _IMAGE_SUFFIXES
 
     def _on_image_generation_finished(self, output_path: str) -> None:
         self._active_image_worker = None
@@ -2390,7 +2564,7 @@ class MainWindow(QMainWindow):
         if output.exists():
             self.statusBar().showMessage(f"Created {output.name}")
             self._go_to(output.parent)
-            QTimer.singleShot(0, lambda: self._select_path(str(output)))
+            QTimer.singleShot(0, partial(self._select_path, str(output)))
 
     def _select_path(self, path: str) -> None:
         source_index = self._model.index(path)
@@ -2402,17 +2576,22 @@ class MainWindow(QMainWindow):
         view = self._file_views.active_view
         selection = view.selectionModel()
         if selection is not None:
-            selection.clear()
-            selection.select(proxy_index, QItemSelectionModel.ClearAndSelect)
-        view.setCurrentIndex(proxy_index)
+            # One call clears, selects and moves the current index.
+            selection.setCurrentIndex(
+                proxy_index, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+            )
+        else:
+            view.setCurrentIndex(proxy_index)
         view.scrollTo(proxy_index)
 
     def _open_settings(self) -> None:
+        self._flush_config_save()
         dialog = SettingsDialog(self)
         dialog.settingsChanged.connect(self._apply_settings)
         dialog.exec()
 
     def _apply_settings(self) -> None:
+        self._config.reload()
         self._confirm_delete = self._config.get_bool("confirm_delete", True)
         self._confirm_overwrite = self._config.get_bool("confirm_overwrite", True)
         self._single_click_open = self._config.get_bool("single_click_open", False)
@@ -2424,35 +2603,63 @@ class MainWindow(QMainWindow):
         self._secure_delete_warning = self._config.get_bool("secure_delete_warning", True)
         self._track_recent = self._config.get_bool("track_recent", False)
         self._warn_executables = self._config.get_bool("warn_executables", True)
+        self._status_bar_details = self._config.get_bool("status_bar_details", True)
+        self._size_units = self._config.get_str("size_units", "auto").upper()
+        self._ai_enabled = self._config.get_bool("ai_enabled", False)
+        self._open_with_last_enabled = self._config.get_bool("enable_open_with_last", True)
+        self._recent_paths = list(self._config.get("recent_paths", []))
         self._hidden_action.setChecked(self._config.get_bool("show_hidden", False))
         self._breadcrumb_bar.setVisible(self._config.get_bool("show_breadcrumbs", True))
         self._file_views.set_view_mode(self._config.get_str("view_mode", "list"))
         self._view_toggle.setChecked(self._config.get_str("view_mode", "list") == "icon")
-        self._sort_column = int(self._config.get("sort_column", 0))
-        self._sort_order = (
+        sort_column = int(self._config.get("sort_column", 0))
+        sort_order = (
             Qt.DescendingOrder
             if self._config.get("sort_order", "asc") == "desc"
             else Qt.AscendingOrder
         )
-        self._apply_sort()
+        if (sort_column, sort_order) != (self._sort_column, self._sort_order):
+            self._sort_column = sort_column
+            self._sort_order = sort_order
+            self._apply_sort()
+        # Each setter below can relayout the views, so only rerun the ones
+        # whose inputs changed since the last apply.
         list_icon_size = int(self._config.get("list_icon_size", 20))
         grid_icon_size = int(self._config.get("grid_icon_size", 64))
-        self._file_views.set_icon_sizes(list_icon_size, grid_icon_size)
+        thumbnail_mode = str(self._config.get("thumbnail_mode", "off")).lower()
+        if self._setting_changed("icons", (list_icon_size, grid_icon_size, thumbnail_mode)):
+            self._file_views.set_icon_sizes(list_icon_size, grid_icon_size)
+            self._apply_thumbnail_mode()
         row_padding = int(self._config.get("row_padding", 6))
         grid_spacing = int(self._config.get("grid_spacing", 12))
-        self._file_views.set_spacing(row_padding, grid_spacing)
+        if self._setting_changed("spacing", (row_padding, grid_spacing)):
+            self._file_views.set_spacing(row_padding, grid_spacing)
         self._proxy.set_folders_first_mode(self._config.get_str("sort_folders_first", "auto"))
         self._apply_style()
-        self._apply_thumbnail_mode()
         self._apply_title_bar()
-        self._places.set_working_sets(self._serialize_working_sets())
+        # Always refresh here: the sidebar section toggles may have changed.
+        self._sidebar_working_sets = self._serialize_working_sets()
+        self._places.set_working_sets(self._sidebar_working_sets)
 
     def _toggle_hidden(self, enabled: bool) -> None:
+        self._config.set("show_hidden", enabled)
+        # setFilter refetches the folder, so rapid toggles apply only the
+        # final state once control returns to the event loop.
+        pending = self._pending_hidden is not None
+        self._pending_hidden = enabled
+        if not pending:
+            QTimer.singleShot(0, self._apply_pending_hidden)
+
+    def _apply_pending_hidden(self) -> None:
+        enabled = self._pending_hidden
+        self._pending_hidden = None
+        if enabled is None:
+            return
         flags = QDir.AllEntries | QDir.NoDotAndDotDot
         if enabled:
             flags |= QDir.Hidden
-        self._model.setFilter(flags)
-        self._config.set("show_hidden", enabled)
+        if self._model.filter() != flags:
+            self._model.setFilter(flags)
         self._update_empty_state()
 
     def _apply_thumbnail_mode(self) -> None:
@@ -2484,17 +2691,21 @@ class MainWindow(QMainWindow):
         self._sort_column = column
         self._config.set("sort_column", column)
         self._apply_sort()
+        self._schedule_config_save()
 
     def _set_sort_order(self, order: Qt.SortOrder) -> None:
         self._sort_order = order
         self._config.set("sort_order", "desc" if order == Qt.DescendingOrder else "asc")
         self._apply_sort()
+        self._schedule_config_save()
 
     def _apply_sort(self) -> None:
         self._file_views.apply_sort(self._sort_column, self._sort_order)
 
     def _apply_title_bar(self) -> None:
         use_custom = self._config.get_bool("custom_titlebar", False)
+        if not self._setting_changed("custom_titlebar", use_custom):
+            return
         self.setWindowFlag(Qt.FramelessWindowHint, use_custom)
         if use_custom:
             self.setMenuWidget(self._title_bar)
@@ -2503,22 +2714,15 @@ class MainWindow(QMainWindow):
         self.show()
 
     def _on_sort_indicator_changed(self, column: int, order: Qt.SortOrder) -> None:
+        if (column, order) == (self._sort_column, self._sort_order):
+            return
         if column != self._sort_column:
             self._sort_column = column
             self._config.set("sort_column", column)
         if order != self._sort_order:
             self._sort_order = order
             self._config.set("sort_order", "desc" if order == Qt.DescendingOrder else "asc")
-        self._config.save()
+        self._schedule_config_save()
 
     def _format_bytes(self, value: int) -> str:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        preferred = str(self._config.get("size_units", "auto")).upper()
-        size = float(value)
-        for unit in units:
-            if preferred != "AUTO" and unit != preferred:
-                size /= 1024
-                continue
-            if size < 1024 or unit == units[-1] or preferred != "AUTO":
-                return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
-            size /= 1024
+        return format_size(value, self._size_units)
@@ -1,18 +1,59 @@
 from __future__ import annotations
 
+import operator
+import os
+from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from pathlib import Path
-import re
-import shutil
-from typing import Any
+from typing import Any, Callable
 
-from PySide6.QtCore import Qt, QSortFilterProxyModel, Signal
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import QFileSystemModel, QMessageBox
 
+from geyma.ops.file_op_worker import FileOpWorker, remove_path
 from geyma.ui.error_dialog import show_error
+from geyma.utils.operation_log import format_timestamp
 
-_SIZE_RE = re.compile(r"^(?P<value>\\d+(?:\\.\\d+)?)(?P<unit>[KMGTP]?B)?$", re.IGNORECASE)
+_SIZE_UNITS = (
+    ("PB", 1024**5),
+    ("TB", 1024**4),
+    ("GB", 1024**3),
+    ("MB", 1024**2),
+    ("KB", 1024),
+    ("B", 1),
+)
+_NUMBER_OPS: dict[str, Callable[[float, float], bool]] = {
+    "eq": operator.eq,
+    "=": operator.eq,
+    ">": operator.gt,
+    "gt": operator.gt,
+    ">=": operator.ge,
+    "gte": operator.ge,
+    "<": operator.lt,
+    "lt": operator.lt,
+    "<=": operator.le,
+    "lte": operator.le,
+}
+_FilterPredicate = Callable[[str, QFileSystemModel, QModelIndex], bool]
+
+
+@dataclass
+class _PendingReplace:
+    index: QPersistentModelIndex
+    value: Any
+    current_path: Path
+    target_path: Path
+    errors: list[str] = field(default_factory=list)
 
 
 class ValidatingFileSystemModel(QFileSystemModel):
@@ -20,65 +61,130 @@ class ValidatingFileSystemModel(QFileSystemModel):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
+        self._pending_replaces: dict[QObject, _PendingReplace] = {}
 
     def setData(self, index, value, role=Qt.EditRole):
-        if role == Qt.EditRole:
-            name = str(value).strip()
-            if not name:
-                show_error(self.parent(), "Rename", "Name cannot be empty.")
+        if role != Qt.EditRole:
+            return super().setData(index, value, role)
+        name = str(value).strip()
+        if not name:
+            show_error(self.parent(), "Rename", "Name cannot be empty.")
+            return False
+        current_path = Path(self.filePath(index))
+        target_path = current_path.with_name(name)
+        if target_path == current_path:
+            self.renameAttempted.emit(str(current_path), str(target_path), False, "No change")
+            return False
+        if target_path.exists():
+            reply = QMessageBox.warning(
+                self.parent(),
+                "Rename",
+                "A file or folder with that name already exists. Replace it?",
+                QMessageBox.Yes | QMessageBox.No,
+            )
+            if reply != QMessageBox.Yes:
+                self.renameAttempted.emit(str(current_path), str(target_path), False, "Name exists")
                 return False
-            current_path = Path(self.filePath(index))
-            target_path = current_path.with_name(name)
-            if target_path == current_path:
-                self.renameAttempted.emit(str(current_path), str(target_path), False, "No change")
+            if target_path.is_dir() and not target_path.is_symlink():
+                # Removing a whole tree can take a while, so do it on the pool
+                # and finish the rename once it is gone.
+                self._replace_directory(index, value, current_path, target_path)
                 return False
-            if target_path.exists():
-                reply = QMessageBox.warning(
-                    self.parent(),
-                    "Rename",
-                    "A file or folder with that name already exists. Replace it?",
-                    QMessageBox.Yes | QMessageBox.No,
-                )
-                if reply != QMessageBox.Yes:
-                    self.renameAttempted.emit(str(current_path), str(target_path), False, "Name exists")
-                    return False
-                try:
-                    if target_path.is_dir() and not target_path.is_symlink():
-                        shutil.rmtree(target_path)
-                    else:
-                        target_path.unlink()
-                except OSError as exc:
-                    show_error(self.parent(), "Rename", str(exc))
-                    self.renameAttempted.emit(str(current_path), str(target_path), False, str(exc))
-                    return False
-        success = super().setData(index, value, role)
-        if role == Qt.EditRole:
-            self.renameAttempted.emit(
-                str(current_path),
-                str(target_path),
-                bool(success),
-                "" if success else "Rename failed",
-            )
+            try:
+                target_path.unlink()
+            except OSError as exc:
+                show_error(self.parent(), "Rename", str(exc))
+                self.renameAttempted.emit(str(current_path), str(target_path), False, str(exc))
+                return False
+        return self._finish_rename(index, value, current_path, target_path)
+
+    def _finish_rename(self, index, value, current_path: Path, target_path: Path) -> bool:
+        success = super().setData(index, value, Qt.EditRole)
+        self.renameAttempted.emit(
+            str(current_path),
+            str(target_path),
+            bool(success),
+            "" if success else "Rename failed",
+        )
         return success
 
+    def _replace_directory(self, index, value, current_path: Path, target_path: Path) -> None:
+        worker = FileOpWorker([str(target_path)], remove_path)
+        self._pending_replaces[worker.signals] = _PendingReplace(
+            QPersistentModelIndex(index), value, current_path, target_path
+        )
+        worker.signals.error.connect(self._on_replace_error)
+        worker.signals.finished.connect(self._on_replace_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_replace_error(self, message: str) -> None:
+        pending = self._pending_replaces.get(self.sender())
+        if pending is not None:
+            pending.errors.append(message)
+
+    def _on_replace_finished(self) -> None:
+        pending = self._pending_replaces.pop(self.sender(), None)
+        if pending is None:
+            return
+        current = str(pending.current_path)
+        target = str(pending.target_path)
+        if pending.errors:
+            error = pending.errors[0]
+            show_error(self.parent(), "Rename", error)
+            self.renameAttempted.emit(current, target, False, error)
+            return
+        if not pending.index.isValid():
+            self.renameAttempted.emit(current, target, False, "Rename failed")
+            return
+        self._finish_rename(
+            QModelIndex(pending.index), pending.value, pending.current_path, pending.target_path
+        )
+
 
 class FilterProxyModel(QSortFilterProxyModel):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._filters: list[dict] = []
+        self._filter_predicates: list[_FilterPredicate] = []
+        self._reject_all = False
         self._folders_first_mode = "auto"
-        self._cut_paths: set[str] = set()
+        self._cut_paths: frozenset[str] = frozenset()
 
     def set_filters(self, filters: list[dict]) -> None:
         self._filters = filters
+        # Identical specs (e.g. the same ext filter added twice) compile once.
+        unique: dict[tuple[str, str, str], dict] = {}
+        for entry in filters:
+            key = (
+                str(entry.get("field", "")).lower(),
+                str(entry.get("op", "")).lower(),
+                repr(entry.get("value")),
+            )
+            unique.setdefault(key, entry)
+        compiled = [_compile_filter(entry) for entry in unique.values()]
+        self._reject_all = any(predicate is None for predicate in compiled)
+        self._filter_predicates = [predicate for predicate in compiled if predicate is not None]
         self.invalidateFilter()
 
     def set_cut_paths(self, paths: list[str] | set[str]) -> None:
-        self._cut_paths = set(paths)
-        self.invalidate()
+        cut_paths = frozenset(paths)
+        changed = cut_paths ^ self._cut_paths
+        self._cut_paths = cut_paths
+        model = self.sourceModel()
+        if not changed or model is None:
+            return
+        for path in changed:
+            index = self.mapFromSource(model.index(path))
+            if not index.isValid():
+                continue
+            last = index.siblingAtColumn(self.columnCount(index.parent()) - 1)
+            self.dataChanged.emit(index, last, [Qt.ForegroundRole])
 
     def set_folders_first_mode(self, mode: str) -> None:
-        self._folders_first_mode = (mode or "auto").lower()
+        mode = (mode or "auto").lower()
+        if mode == self._folders_first_mode:
+            return
+        self._folders_first_mode = mode
         self.invalidate()
 
     def data(self, index, role=Qt.DisplayRole):
@@ -115,44 +221,133 @@ class FilterProxyModel(QSortFilterProxyModel):
         index = model.index(source_row, 0, source_parent)
         if not index.isValid():
             return False
-        info = model.fileInfo(index)
-        name = info.fileName()
-        path = info.absoluteFilePath()
-        size = info.size()
-        mtime = info.lastModified().toSecsSinceEpoch()
-        for entry in self._filters:
-            field = str(entry.get("field", "")).lower()
-            op = str(entry.get("op", "")).lower()
-            value = entry.get("value")
-            if field == "ext":
-                ext = name.rsplit(".", 1)[-1].lower() if "." in name else ""
-                if op not in {"eq", "="} or ext != str(value).lower().lstrip("."):
-                    return False
-            elif field == "name":
-                if op != "contains" or str(value).lower() not in name.lower():
-                    return False
-            elif field == "path":
-                if op != "contains" or str(value).lower() not in path.lower():
-                    return False
-            elif field == "size":
-                parsed = _parse_size(value)
-                if parsed is None or not _compare_number(size, op, parsed):
-                    return False
-            elif field == "mtime":
-                parsed = _parse_date(value)
-                if parsed is None:
-                    return False
-                if op in {"eq", "="}:
-                    file_date = datetime.fromtimestamp(mtime).date()
-                    if file_date != parsed.date():
-                        return False
-                elif not _compare_number(mtime, op, parsed.timestamp()):
-                    return False
-            else:
+        if self._reject_all:
+            return False
+        # Predicates read name, path, size and mtime through the model's own
+        # accessors rather than building a QFileInfo per row.
+        name = model.fileName(index)
+        for predicate in self._filter_predicates:
+            if not predicate(name, model, index):
                 return False
         return True
 
 
+class ActivityModel(QAbstractTableModel):
+    HEADERS = ("When", "Action", "Item", "Destination", "Status")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._entries: list[dict] = []
+        self._labels: dict[int, tuple[str, str, str, str, str]] = {}
+
+    def set_entries(self, entries: list[dict]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self._labels = {}
+        self.endResetModel()
+
+    def entry(self, row: int) -> dict | None:
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def rowCount(self, parent=None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            labels = self._labels.get(index.row())
+            if labels is None:
+                labels = self._format_entry(entry)
+                self._labels[index.row()] = labels
+            return labels[column]
+        if role == Qt.ToolTipRole:
+            if column == 2:
+                return "\n".join(entry.get("sources", [])) or None
+            if column == 3:
+                return "\n".join(entry.get("destinations", [])) or None
+            if column == 4 and not entry.get("success", True) and entry.get("error"):
+                return str(entry.get("error"))
+            return None
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+    @staticmethod
+    def _format_entry(entry: dict) -> tuple[str, str, str, str, str]:
+        when_label = format_timestamp(str(entry.get("timestamp", "")))
+        action = str(entry.get("action", "")).replace("_", " ").title()
+        source_label = _summarize_paths(entry.get("sources", []))
+        dest_label = _summarize_paths(entry.get("destinations", []))
+        status = "OK" if entry.get("success", True) else "Failed"
+        return when_label, action, source_label, dest_label, status
+
+
+def _compile_filter(entry: dict) -> _FilterPredicate | None:
+    """Build a predicate for one filter spec, or return None if it can never match."""
+    field = str(entry.get("field", "")).lower()
+    op = str(entry.get("op", "")).lower()
+    value = entry.get("value")
+    if field == "ext":
+        if op not in {"eq", "="}:
+            return None
+        wanted = str(value).lower().lstrip(".")
+        return lambda name, model, index: _name_extension(name) == wanted
+    if field in {"name", "path"}:
+        if op != "contains":
+            return None
+        needle = str(value).lower()
+        if field == "name":
+            return lambda name, model, index: needle in name.lower()
+        return lambda name, model, index: needle in model.filePath(index).lower()
+    compare = _NUMBER_OPS.get(op)
+    if field == "size":
+        parsed = _parse_size(value)
+        if parsed is None or compare is None:
+            return None
+        return lambda name, model, index: compare(model.size(index), parsed)
+    if field == "mtime":
+        parsed = _parse_date(value)
+        if parsed is None or compare is None:
+            return None
+        if op in {"eq", "="}:
+            day = parsed.date()
+            return lambda name, model, index: (
+                datetime.fromtimestamp(model.lastModified(index).toSecsSinceEpoch()).date() == day
+            )
+        stamp = parsed.timestamp()
+        return lambda name, model, index: compare(
+            model.lastModified(index).toSecsSinceEpoch(), stamp
+        )
+    return None
+
+
+def _name_extension(name: str) -> str:
+    _, dot, suffix = name.rpartition(".")
+    return suffix.lower() if dot else ""
+
+
+def _summarize_paths(paths: list[str]) -> str:
+    if not paths:
+        return ""
+    first = os.path.basename(paths[0])
+    if len(paths) == 1:
+        return first
+    return f"{first} (+{len(paths) - 1})"
+
+
 def _parse_size(value: Any) -> int | None:
     if isinstance(value, (int, float)):
         return int(value)
@@ -161,22 +356,16 @@ def _parse_size(value: Any) -> int | None:
     text = str(value).strip()
     if text.isdigit():
         return int(text)
-    match = _SIZE_RE.match(text)
-    if not match:
-        return None
-    number = float(match.group("value"))
-    unit = (match.group("unit") or "B").upper()
-    multipliers = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-        "PB": 1024**5,
-    }
-    if unit not in multipliers:
+    text = text.upper()
+    multiplier = 1
+    for suffix, unit in _SIZE_UNITS:
+        if text.endswith(suffix):
+            text = text[: -len(suffix)]
+            multiplier = unit
+            break
+    if not text.replace(".", "", 1).isdigit():
         return None
-    return int(number * multipliers[unit])
+    return int(float(text) * multiplier)
 
 
 def _parse_date(value: Any) -> datetime | None:
@@ -196,17 +385,3 @@ def _parse_date(value: Any) -> datetime | None:
             return parsed
         return datetime.combine(parsed, time.min)
     return None
-
-
-def _compare_number(left: float, op: str, right: float) -> bool:
-    if op in {"eq", "="}:
-        return left == right
-    if op in {">", "gt"}:
-        return left > right
-    if op in {">=", "gte"}:
-        return left >= right
-    if op in {"<", "lt"}:
-        return left < right
-    if op in {"<=", "lte"}:
-        return left <= right
-    return False
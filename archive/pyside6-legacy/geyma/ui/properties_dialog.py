@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import os
-import shutil
 import stat
-from typing import Callable
+import threading
 
 from PySide6.QtCore import QDateTime, QObject, QRunnable, QThreadPool, Signal, Qt
 from PySide6.QtCore import QLocale, QProcess
@@ -26,6 +27,9 @@ from PySide6.QtWidgets import (
 
 from geyma.ui.dialog_utils import apply_dialog_titlebar
 from geyma.ui.error_dialog import show_error
+from geyma.utils.config import ConfigStore
+from geyma.utils.desktop_open import open_commands
+from geyma.utils.formatting import format_size
 try:
     import grp
     import pwd
@@ -33,50 +37,111 @@ except ImportError:  # pragma: no cover - platform-specific
     grp = None
     pwd = None
 
+_FOLDER_SIZE_THREADS = 8
+_FOLDER_SIZE_PROGRESS_FILES = 2048
+_PERMISSION_COLUMNS = (
+    ("Owner", (stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR)),
+    ("Group", (stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP)),
+    ("Others", (stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH)),
+)
+_PERMISSION_BITS = 0o777
+
+
+@lru_cache(maxsize=1)
+def _mime_database() -> QMimeDatabase:
+    return QMimeDatabase()
+
 
 class _FolderSizeSignals(QObject):
-    finished = Signal(int, int, int)
+    progress = Signal("qint64", int, int)
+    finished = Signal("qint64", int, int)
     canceled = Signal()
 
 
 class _FolderSizeWorker(QRunnable):
-    def __init__(self, root: Path, should_cancel: Callable[[], bool]) -> None:
+    def __init__(
+        self,
+        root: Path,
+        cancel: threading.Event,
+        ignore_names: frozenset[str] = frozenset(),
+    ) -> None:
         super().__init__()
-        self._root = root
-        self._should_cancel = should_cancel
+        self._root = os.fspath(root)
+        self._cancel = cancel
+        self._ignore_names = ignore_names
         self.signals = _FolderSizeSignals()
 
     def run(self) -> None:
-        total = 0
-        file_count = 0
-        folder_count = 0
-        stack = [self._root]
-        while stack:
-            if self._should_cancel():
-                self.signals.canceled.emit()
-                return
-            current = stack.pop()
-            try:
-                with os.scandir(current) as entries:
-                    for entry in entries:
-                        if self._should_cancel():
-                            self.signals.canceled.emit()
-                            return
-                        try:
-                            if entry.is_symlink():
+        # Directories are shared through one queue so several threads can
+        # keep scandir calls in flight; each thread tallies locally.
+        canceled = self._cancel
+        ignore_names = self._ignore_names
+        pending = deque([self._root])
+        condition = threading.Condition()
+        totals = [0, 0, 0]
+        active = 0
+
+        def walk() -> None:
+            nonlocal active
+            total = 0
+            file_count = 0
+            folder_count = 0
+            while True:
+                with condition:
+                    while not pending and active and not canceled.is_set():
+                        condition.wait()
+                    if canceled.is_set() or not pending:
+                        condition.notify_all()
+                        break
+                    current = pending.popleft()
+                    active += 1
+                subdirs: list[str] = []
+                add_subdir = subdirs.append
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if entry.name not in ignore_names:
+                                        add_subdir(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    total += entry.stat(follow_symlinks=False).st_size
+                                    file_count += 1
+                            except OSError:
                                 continue
-                            if entry.is_dir(follow_symlinks=False):
-                                folder_count += 1
-                                stack.append(Path(entry.path))
-                            elif entry.is_file(follow_symlinks=False):
-                                total += entry.stat(follow_symlinks=False).st_size
-                                file_count += 1
-                        except OSError:
-                            continue
-            except OSError:
-                continue
-
-        self.signals.finished.emit(total, file_count, folder_count)
+                except OSError:
+                    pass
+                folder_count += len(subdirs)
+                snapshot = None
+                with condition:
+                    pending.extend(subdirs)
+                    active -= 1
+                    if file_count >= _FOLDER_SIZE_PROGRESS_FILES:
+                        totals[0] += total
+                        totals[1] += file_count
+                        totals[2] += folder_count
+                        total = file_count = folder_count = 0
+                        snapshot = tuple(totals)
+                    condition.notify_all()
+                if snapshot is not None:
+                    self.signals.progress.emit(*snapshot)
+            with condition:
+                totals[0] += total
+                totals[1] += file_count
+                totals[2] += folder_count
+
+        threads = [
+            threading.Thread(target=walk, daemon=True)
+            for _ in range(min(_FOLDER_SIZE_THREADS, os.cpu_count() or 1))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if canceled.is_set():
+            self.signals.canceled.emit()
+            return
+        self.signals.finished.emit(totals[0], totals[1], totals[2])
 
 
 @dataclass
@@ -99,23 +164,46 @@ class PropertiesDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Properties")
         self._path = path
-        self._cancel_size = False
+        self._cancel_size = threading.Event()
         self._current_mode = 0
-        self._perm_boxes: dict[str, QCheckBox] = {}
+        self._perm_boxes: list[tuple[int, QCheckBox]] = []
+        self._locale = QLocale()
+        self._load_settings()
 
         self._size_label = QLabel("--")
         self._contents_label = QLabel("--")
         self._build_ui()
         self._load_data()
 
+    def _load_settings(self) -> None:
+        try:
+            config = ConfigStore()
+            self._permissions_enabled = config.get_bool("permissions_editor_enabled", True)
+            self._open_backend = config.get_str("open_backend", "auto").lower()
+            self._date_format = config.get_str("date_format", "locale")
+            self._size_units = str(config.get("size_units", "auto")).upper()
+            ignore = config.get("folder_size_ignore", []) or []
+            if isinstance(ignore, str):
+                ignore = ignore.split(",")
+            self._folder_size_ignore = frozenset(
+                str(name).strip() for name in ignore if str(name).strip()
+            )
+            if self._date_format.lower() in {"locale", "system"}:
+                self._date_format = ""
+        except Exception:
+            self._permissions_enabled = True
+            self._open_backend = "auto"
+            self._date_format = ""
+            self._size_units = "AUTO"
+            self._folder_size_ignore = frozenset()
+
     def closeEvent(self, event) -> None:
-        self._cancel_size = True
+        self._cancel_size.set()
         super().closeEvent(event)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         self._tabs = QTabWidget()
-        self._permissions_enabled = True
 
         self._name_label = QLabel()
         self._path_label = QLabel()
@@ -163,22 +251,15 @@ class PropertiesDialog(QDialog):
         general_layout.addLayout(button_row)
         general_layout.addStretch(1)
 
-        permissions_widget = QWidget()
-        permissions_layout = QVBoxLayout(permissions_widget)
-        permissions_layout.addWidget(QLabel("Permissions"))
-        self._permissions_editor = self._build_permissions_editor()
-        permissions_layout.addLayout(self._permissions_editor)
-        permissions_layout.addStretch(1)
-
-        security_widget = QWidget()
-        security_layout = QVBoxLayout(security_widget)
-        security_layout.addWidget(QLabel("Security"))
-        security_layout.addWidget(QLabel("No additional security details available."))
-        security_layout.addStretch(1)
-
+        # The other tabs start empty and are filled the first time they're shown.
         self._tabs.addTab(general_widget, "General")
-        self._tabs.addTab(permissions_widget, "Permissions")
-        self._tabs.addTab(security_widget, "Security")
+        permissions_index = self._tabs.addTab(QWidget(), "Permissions")
+        security_index = self._tabs.addTab(QWidget(), "Security")
+        self._tab_builders = {
+            permissions_index: self._build_permissions_tab,
+            security_index: self._build_security_tab,
+        }
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self._tabs)
         layout.addWidget(buttons)
@@ -204,20 +285,15 @@ class PropertiesDialog(QDialog):
             self._apply_data(data)
             return
 
-        try:
-            from geyma.utils.config import ConfigStore
-
-            self._permissions_enabled = ConfigStore().get_bool("permissions_editor_enabled", True)
-        except Exception:
-            self._permissions_enabled = True
-
         self._current_mode = info.st_mode
+        is_dir = stat.S_ISDIR(info.st_mode)
+        is_file = stat.S_ISREG(info.st_mode)
         data = _PropertiesData(
             name=self._path.name,
             path=str(self._path),
-            kind=self._detect_kind(),
-            size_text=self._format_bytes(info.st_size) if self._path.is_file() else "Calculating...",
-            contents_text="--" if self._path.is_file() else "Calculating...",
+            kind=self._detect_kind(info.st_mode),
+            size_text=self._format_bytes(info.st_size) if is_file else "Calculating...",
+            contents_text="--" if is_file else "Calculating...",
             modified=self._format_time(info.st_mtime),
             created=self._format_time(info.st_ctime),
             accessed=self._format_time(info.st_atime),
@@ -226,11 +302,8 @@ class PropertiesDialog(QDialog):
             group=self._lookup_group(info.st_gid),
         )
         self._apply_data(data)
-        self._set_permissions_from_mode(info.st_mode)
-        if not self._permissions_enabled:
-            self._disable_permissions_editor()
 
-        if self._path.is_dir():
+        if is_dir:
             self._start_folder_size()
 
     def _apply_data(self, data: _PropertiesData) -> None:
@@ -247,17 +320,20 @@ class PropertiesDialog(QDialog):
         self._group_label.setText(data.group)
 
     def _start_folder_size(self) -> None:
-        worker = _FolderSizeWorker(self._path, lambda: self._cancel_size)
+        worker = _FolderSizeWorker(self._path, self._cancel_size, self._folder_size_ignore)
+        worker.signals.progress.connect(self._on_folder_size_progress)
         worker.signals.finished.connect(self._on_folder_size)
         worker.signals.canceled.connect(self._on_folder_size_canceled)
         QThreadPool.globalInstance().start(worker)
 
-    def _detect_kind(self) -> str:
-        if self._path.is_dir():
+    def _detect_kind(self, mode: int) -> str:
+        if stat.S_ISDIR(mode):
             return "Folder"
-        if self._path.is_file():
-            db = QMimeDatabase()
-            mime = db.mimeTypeForFile(str(self._path), QMimeDatabase.MatchContent)
+        if stat.S_ISREG(mode):
+            database = _mime_database()
+            mime = database.mimeTypeForFile(str(self._path), QMimeDatabase.MatchExtension)
+            if not mime.isValid() or mime.isDefault():
+                mime = database.mimeTypeForFile(str(self._path), QMimeDatabase.MatchContent)
             if mime.isValid():
                 return f"File ({mime.comment()})"
         return "File"
@@ -275,15 +351,34 @@ class PropertiesDialog(QDialog):
         clipboard = QGuiApplication.clipboard()
         clipboard.setText(str(self._path))
 
+    def _ensure_tab_built(self, index: int) -> None:
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(QVBoxLayout(self._tabs.widget(index)))
+
+    def _build_permissions_tab(self, layout: QVBoxLayout) -> None:
+        layout.addWidget(QLabel("Permissions"))
+        self._permissions_editor = self._build_permissions_editor()
+        layout.addLayout(self._permissions_editor)
+        layout.addStretch(1)
+        self._set_permissions_from_mode(self._current_mode)
+        if not self._permissions_enabled:
+            self._disable_permissions_editor()
+
+    @staticmethod
+    def _build_security_tab(layout: QVBoxLayout) -> None:
+        layout.addWidget(QLabel("Security"))
+        layout.addWidget(QLabel("No additional security details available."))
+        layout.addStretch(1)
+
     def _build_permissions_editor(self) -> QHBoxLayout:
         layout = QHBoxLayout()
-        for label, prefix in (("Owner", "u"), ("Group", "g"), ("Others", "o")):
+        for label, masks in _PERMISSION_COLUMNS:
             column = QVBoxLayout()
             column.addWidget(QLabel(label))
-            for perm_label, suffix in (("Read", "r"), ("Write", "w"), ("Execute", "x")):
-                key = f"{prefix}{suffix}"
+            for perm_label, mask in zip(("Read", "Write", "Execute"), masks, strict=True):
                 box = QCheckBox(perm_label)
-                self._perm_boxes[key] = box
+                self._perm_boxes.append((mask, box))
                 column.addWidget(box)
             layout.addLayout(column)
         apply_button = QPushButton("Apply Permissions")
@@ -294,21 +389,8 @@ class PropertiesDialog(QDialog):
         return layout
 
     def _set_permissions_from_mode(self, mode: int) -> None:
-        mapping = {
-            "ur": stat.S_IRUSR,
-            "uw": stat.S_IWUSR,
-            "ux": stat.S_IXUSR,
-            "gr": stat.S_IRGRP,
-            "gw": stat.S_IWGRP,
-            "gx": stat.S_IXGRP,
-            "or": stat.S_IROTH,
-            "ow": stat.S_IWOTH,
-            "ox": stat.S_IXOTH,
-        }
-        for key, mask in mapping.items():
-            box = self._perm_boxes.get(key)
-            if box is not None:
-                box.setChecked(bool(mode & mask))
+        for mask, box in self._perm_boxes:
+            box.setChecked(bool(mode & mask))
 
     def _apply_permissions(self) -> None:
         if not self._perm_boxes:
@@ -316,26 +398,8 @@ class PropertiesDialog(QDialog):
         if not self._permissions_enabled:
             show_error(self, "Permissions", "Permissions editor is disabled in settings.")
             return
-        mode = stat.S_IMODE(self._current_mode)
-        mapping = {
-            "ur": stat.S_IRUSR,
-            "uw": stat.S_IWUSR,
-            "ux": stat.S_IXUSR,
-            "gr": stat.S_IRGRP,
-            "gw": stat.S_IWGRP,
-            "gx": stat.S_IXGRP,
-            "or": stat.S_IROTH,
-            "ow": stat.S_IWOTH,
-            "ox": stat.S_IXOTH,
-        }
-        for key, mask in mapping.items():
-            box = self._perm_boxes.get(key)
-            if box is None:
-                continue
-            if box.isChecked():
-                mode |= mask
-            else:
-                mode &= ~mask
+        checked = sum(mask for mask, box in self._perm_boxes if box.isChecked())
+        mode = (stat.S_IMODE(self._current_mode) & ~_PERMISSION_BITS) | checked
         try:
             os.chmod(self._path, mode)
             self._current_mode = mode
@@ -344,41 +408,21 @@ class PropertiesDialog(QDialog):
             show_error(self, "Permissions", str(exc))
 
     def _disable_permissions_editor(self) -> None:
-        for box in self._perm_boxes.values():
+        for _mask, box in self._perm_boxes:
             box.setEnabled(False)
         if hasattr(self, "_permissions_apply_button"):
             self._permissions_apply_button.setEnabled(False)
 
-    @staticmethod
-    def _open_path(path: Path) -> bool:
-        try:
-            from geyma.utils.config import ConfigStore
-
-            preferred = ConfigStore().get_str("open_backend", "auto").lower()
-        except Exception:
-            preferred = "auto"
-        candidates = PropertiesDialog._open_candidates(str(path), preferred)
-        for command, args in candidates:
-            if shutil.which(command) and QProcess.startDetached(command, args):
+    def _open_path(self, path: Path) -> bool:
+        target = str(path)
+        for command, args in open_commands(self._open_backend):
+            if QProcess.startDetached(command, [*args, target]):
                 return True
         return False
 
-    @staticmethod
-    def _open_candidates(path: str, preferred: str) -> list[tuple[str, list[str]]]:
-        kde = [
-            ("kioclient6", ["exec", path]),
-            ("kioclient5", ["exec", path]),
-            ("kde-open5", [path]),
-        ]
-        gio = [("gio", ["open", path])]
-        xdg = [("xdg-open", [path])]
-        if preferred == "kde":
-            return kde + gio + xdg
-        if preferred == "gio":
-            return gio + kde + xdg
-        if preferred == "xdg":
-            return xdg + kde + gio
-        return kde + gio + xdg
+    def _on_folder_size_progress(self, total: int, files: int, folders: int) -> None:
+        self._size_label.setText(f"{self._format_bytes(total)} (calculating...)")
+        self._contents_label.setText(f"{files} files, {folders} folders (calculating...)")
 
     def _on_folder_size(self, total: int, files: int, folders: int) -> None:
         self._size_label.setText(self._format_bytes(total))
@@ -390,52 +434,19 @@ class PropertiesDialog(QDialog):
 
     def _format_time(self, value: float) -> str:
         timestamp = QDateTime.fromSecsSinceEpoch(int(value))
-        try:
-            from geyma.utils.config import ConfigStore
-
-            preferred = ConfigStore().get_str("date_format", "locale")
-        except Exception:
-            preferred = "locale"
-        if preferred and preferred.lower() not in {"locale", "system"}:
-            return timestamp.toString(preferred)
-        return QLocale().toString(timestamp, QLocale.ShortFormat)
+        if self._date_format:
+            return timestamp.toString(self._date_format)
+        return self._locale.toString(timestamp, QLocale.ShortFormat)
 
     def _format_bytes(self, value: int) -> str:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        try:
-            from geyma.utils.config import ConfigStore
-
-            preferred = str(ConfigStore().get("size_units", "auto")).upper()
-        except Exception:
-            preferred = "AUTO"
-        size = float(value)
-        for unit in units:
-            if preferred != "AUTO" and unit != preferred:
-                size /= 1024
-                continue
-            if size < 1024 or unit == units[-1] or preferred != "AUTO":
-                return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
-            size /= 1024
-        return f"{int(size)} B"
+        return format_size(value, self._size_units)
 
     @staticmethod
     def _format_permissions(mode: int) -> str:
-        def triad(mask_r, mask_w, mask_x) -> str:
-            return (
-                ("r" if mode & mask_r else "-")
-                + ("w" if mode & mask_w else "-")
-                + ("x" if mode & mask_x else "-")
-            )
-
-        return "".join(
-            [
-                triad(stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR),
-                triad(stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP),
-                triad(stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH),
-            ]
-        )
+        return stat.filemode(mode)[1:]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _lookup_owner(uid: int) -> str:
         if pwd is None:
             return str(uid)
@@ -445,6 +456,7 @@ class PropertiesDialog(QDialog):
             return str(uid)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _lookup_group(gid: int) -> str:
         if grp is None:
             return str(gid)
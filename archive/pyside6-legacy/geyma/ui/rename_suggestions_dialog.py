@@ -40,7 +40,6 @@ class RenameSuggestionsDialog(QDialog):
         self.setWindowTitle("Rename Suggestions")
         self._apply_callback = apply_callback
         self._items = collect_items(paths)
-        self._suggestions: dict[str, str] = {}
 
         self._status = QLabel("Ready")
         self._ai_label = QLabel("AI-assisted result")
@@ -89,16 +88,21 @@ class RenameSuggestionsDialog(QDialog):
         self._populate_table()
 
     def _populate_table(self) -> None:
-        self._table.setRowCount(0)
-        for item in self._items:
-            row = self._table.rowCount()
-            self._table.insertRow(row)
-            use_item = QTableWidgetItem()
+        table = self._table
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(self._items))
+        for row, item in enumerate(self._items):
+            use_item = table.item(row, 0)
+            if use_item is None:
+                use_item = QTableWidgetItem()
+                use_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                table.setItem(row, 0, use_item)
+                table.setItem(row, 1, QTableWidgetItem())
+                table.setItem(row, 2, QTableWidgetItem())
             use_item.setCheckState(Qt.Unchecked)
-            use_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            self._table.setItem(row, 0, use_item)
-            self._table.setItem(row, 1, QTableWidgetItem(item.get("name", "")))
-            self._table.setItem(row, 2, QTableWidgetItem(""))
+            table.item(row, 1).setText(item.get("name", ""))
+            table.item(row, 2).setText("")
+        table.setUpdatesEnabled(True)
 
     def _generate(self) -> None:
         if not self._items:
@@ -131,20 +135,21 @@ class RenameSuggestionsDialog(QDialog):
         self._generate_button.setEnabled(True)
         self._error.setText(result.get("error", ""))
         self._ai_label.setVisible(result.get("source") == "ai")
-        suggestions = result.get("suggestions", [])
-        self._suggestions = {
+        by_name = {
             str(entry.get("original")): str(entry.get("proposed"))
-            for entry in suggestions
+            for entry in result.get("suggestions", [])
             if entry.get("original") and entry.get("proposed")
         }
         applied = 0
+        table_item = self._table.item
+        self._table.setUpdatesEnabled(False)
         for row, item in enumerate(self._items):
-            current_name = item.get("name", "")
-            proposed = self._suggestions.get(current_name, "")
+            proposed = by_name.get(item.get("name", ""))
             if proposed:
-                self._table.item(row, 2).setText(proposed)
-                self._table.item(row, 0).setCheckState(Qt.Checked)
+                table_item(row, 2).setText(proposed)
+                table_item(row, 0).setCheckState(Qt.Checked)
                 applied += 1
+        self._table.setUpdatesEnabled(True)
         self._apply_button.setEnabled(applied > 0)
         self._status.setText(f"Suggestions ready ({applied})")
 
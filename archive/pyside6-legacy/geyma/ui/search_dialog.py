@@ -52,6 +52,7 @@ class SearchDialog(QDialog):
         self._ai_badge = QLabel("AI used")
         self._ai_badge.setVisible(False)
         self._results = QListWidget()
+        self._results.setUniformItemSizes(True)
         self._scope = QComboBox()
         self._scope.addItems(["Current Folder", "This Folder + Subfolders", "System (All Files)"])
         self._scope.setCurrentIndex(self._scope_index(self._default_scope))
@@ -108,7 +109,7 @@ class SearchDialog(QDialog):
             recursive=recursive,
             filters=self._filters,
         )
-        worker.signals.found.connect(self._results.addItem)
+        worker.signals.foundBatch.connect(self._results.addItems)
         worker.signals.progress.connect(lambda count: self._status_label.setText(f"Scanned {count} items"))
         worker.signals.error.connect(lambda message: self._status_label.setText(message))
         worker.signals.finished.connect(self._finish_search)
@@ -181,10 +182,11 @@ class SearchDialog(QDialog):
             return 2
         return 0
 
-    def _resolve_scope(self) -> tuple[Path, bool, str]:
+    def _resolve_scope(self) -> tuple[str, bool, str]:
         index = self._scope.currentIndex()
+        root = str(self._root)
         if index == 1:
-            return self._root, True, "This Folder + Subfolders"
+            return root, True, "This Folder + Subfolders"
         if index == 2:
-            return Path("/"), True, "System (All Files)"
-        return self._root, False, "Current Folder"
+            return "/", True, "System (All Files)"
+        return root, False, "Current Folder"
@@ -38,6 +38,12 @@ from geyma.ui.bookmarks_dialog import BookmarksDialog
 from geyma.ui.dialog_utils import apply_dialog_titlebar
 from geyma.utils.config import ConfigStore
 
+_SEARCH_DELAY_MS = 150
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
 
 class _SettingsRow(QWidget):
     def __init__(
@@ -53,6 +59,7 @@ class _SettingsRow(QWidget):
         self._keywords = (keywords or "").strip()
         self._title = (title or "").strip()
         self._description = (description or "").strip()
+        self._haystack = f"{self._title} {self._description} {self._keywords}".lower()
 
         if not self._title and not self._description:
             self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
@@ -95,12 +102,12 @@ class _SettingsRow(QWidget):
         control.setMinimumWidth(0)
         layout.addWidget(control, 0, Qt.AlignRight | Qt.AlignVCenter)
 
+    @property
+    def haystack(self) -> str:
+        return self._haystack
+
     def matches(self, query: str) -> bool:
-        q = (query or "").strip().lower()
-        if not q:
-            return True
-        haystack = " ".join([self._title, self._description, self._keywords]).lower()
-        return q in haystack
+        return not query or query in self._haystack
 
 
 class _SettingsCard(QFrame):
@@ -200,9 +207,13 @@ class SettingsDialog(QDialog):
         self._dirty = False
         self._search_rows: dict[str, list[_SettingsRow]] = {}
         self._search_cards: dict[str, list[tuple[QFrame, list[_SettingsRow]]]] = {}
+        self._search_trigrams: dict[str, dict[str, set[_SettingsRow]]] = {}
+        self._last_search_query: str | None = None
+        self._visible_rows: dict[str, set[_SettingsRow]] = {}
         self._page_builders: dict[str, callable] = {}
         self._page_built: set[str] = set()
         self._page_containers: dict[str, QWidget] = {}
+        self._pending_page: str | None = None
         # Pages are built lazily on navigation to avoid freezing the UI.
 
         self._nav = QListWidget()
@@ -218,7 +229,11 @@ class SettingsDialog(QDialog):
         self._search = QLineEdit()
         self._search.setPlaceholderText("Search settings…")
         self._search.setClearButtonEnabled(True)
-        self._search.textChanged.connect(self._apply_search_filter)
+        self._search.textChanged.connect(self._schedule_search_filter)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(lambda: self._apply_search_filter(self._search.text()))
 
         self._status = QLabel("")
         self._status.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
@@ -304,7 +319,18 @@ class SettingsDialog(QDialog):
         if item is None:
             return
         key = str(item.data(Qt.UserRole))
-        self._ensure_page_built(key)
+        if key in self._page_built:
+            return
+        # Let the placeholder paint before the page's widgets are built; only
+        # the page still selected when the event loop comes back gets built.
+        if self._pending_page is None:
+            QTimer.singleShot(0, self._build_pending_page)
+        self._pending_page = key
+
+    def _build_pending_page(self) -> None:
+        key, self._pending_page = self._pending_page, None
+        if key is not None:
+            self._ensure_page_built(key)
 
     def _ensure_page_built(self, key: str) -> None:
         if key in self._page_built:
@@ -314,23 +340,27 @@ class SettingsDialog(QDialog):
         if builder is None or container is None:
             return
         page = builder()
-        layout = container.layout()
-        if layout is None:
-            layout = QVBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-        layout.addWidget(page)
+        page.setObjectName(container.objectName())
+        was_current = self._stack.currentWidget() is container
+        self._stack.insertWidget(self._stack.indexOf(container), page)
+        self._stack.removeWidget(container)
+        container.deleteLater()
+        if was_current:
+            self._stack.setCurrentWidget(page)
+        self._page_containers[key] = page
         self._page_built.add(key)
         if self._search.text().strip():
+            self._last_search_query = None
             self._apply_search_filter(self._search.text())
 
     def _wrap_page(self, key: str, title: str, cards: list[tuple[QFrame, list[_SettingsRow]]]) -> QWidget:
         self._search_cards[key] = cards
         self._search_rows[key] = [row for _card, rows in cards for row in rows]
+        trigrams: dict[str, set[_SettingsRow]] = {}
+        for row in self._search_rows[key]:
+            for gram in _trigrams(row.haystack):
+                trigrams.setdefault(gram, set()).add(row)
+        self._search_trigrams[key] = trigrams
 
         content = QWidget()
         layout = QVBoxLayout(content)
@@ -366,40 +396,74 @@ class SettingsDialog(QDialog):
             self._set_dirty(True)
         self._status.setText("")
 
+    def _on_control_changed(self, *_args) -> None:
+        self._touch()
+
     def _track(self, widget: QWidget) -> None:
         if isinstance(widget, QCheckBox):
-            widget.toggled.connect(lambda *_: self._touch())
+            widget.toggled.connect(self._on_control_changed)
             return
         if isinstance(widget, QLineEdit):
-            widget.textChanged.connect(lambda *_: self._touch())
+            widget.textChanged.connect(self._on_control_changed)
             return
         if isinstance(widget, QComboBox):
-            widget.currentIndexChanged.connect(lambda *_: self._touch())
+            widget.currentIndexChanged.connect(self._on_control_changed)
             return
         if isinstance(widget, QSpinBox):
-            widget.valueChanged.connect(lambda *_: self._touch())
+            widget.valueChanged.connect(self._on_control_changed)
             return
 
+    def _schedule_search_filter(self, text: str) -> None:
+        if text.strip():
+            self._search_timer.start()
+            return
+        self._search_timer.stop()
+        self._apply_search_filter(text)
+
     def _apply_search_filter(self, text: str) -> None:
         query = text.strip().lower()
-        for idx in range(self._nav.count()):
-            item = self._nav.item(idx)
-            key = item.data(Qt.UserRole)
-            if key not in self._page_built:
-                item.setHidden(False)
-                continue
-            cards = self._search_cards.get(key, [])
-            any_match = False
-            for card, rows in cards:
-                card_match = False
-                for row in rows:
-                    visible = not query or row.matches(query)
-                    row.setVisible(visible)
-                    if visible:
-                        card_match = True
-                        any_match = True
-                card.setVisible(card_match or not query)
-            item.setHidden(bool(query) and not any_match)
+        previous = self._last_search_query
+        if query == previous:
+            return
+        self._last_search_query = query
+        # A query that extends the previous one can only hide more rows, so
+        # only the rows still visible need checking.
+        narrowing = bool(previous) and query.startswith(previous)
+        query_grams = _trigrams(query)
+        self._stack.setUpdatesEnabled(False)
+        try:
+            for idx in range(self._nav.count()):
+                item = self._nav.item(idx)
+                key = item.data(Qt.UserRole)
+                if key not in self._page_built:
+                    item.setHidden(False)
+                    continue
+                cards = self._search_cards.get(key, [])
+                # Rows sharing every trigram of the query are the only candidates;
+                # the substring check then confirms them.
+                candidates = None
+                if query_grams:
+                    index = self._search_trigrams.get(key, {})
+                    candidates = set.intersection(*(index.get(gram, set()) for gram in query_grams))
+                still_visible = self._visible_rows.get(key) if narrowing else None
+                visible_rows: set[_SettingsRow] = set()
+                for card, rows in cards:
+                    card_match = False
+                    for row in rows:
+                        if still_visible is not None and row not in still_visible:
+                            continue
+                        visible = not query or (
+                            (candidates is None or row in candidates) and row.matches(query)
+                        )
+                        row.setVisible(visible)
+                        if visible:
+                            visible_rows.add(row)
+                            card_match = True
+                    card.setVisible(card_match or not query)
+                self._visible_rows[key] = visible_rows
+                item.setHidden(bool(query) and not visible_rows)
+        finally:
+            self._stack.setUpdatesEnabled(True)
 
     def _build_general_page(self) -> QWidget:
         cards: list[tuple[QFrame, list[_SettingsRow]]] = []
@@ -486,6 +550,12 @@ class SettingsDialog(QDialog):
         self._date_format = QLineEdit(self._config.get_str("date_format", "locale"))
         self._track(self._date_format)
 
+        self._folder_size_ignore = QLineEdit(
+            ", ".join(str(name) for name in self._config.get("folder_size_ignore", []) or [])
+        )
+        self._folder_size_ignore.setPlaceholderText(".git, node_modules")
+        self._track(self._folder_size_ignore)
+
         self._folders_first_mode = QComboBox()
         self._folders_first_mode.addItem("Auto (like Windows Explorer)", "auto")
         self._folders_first_mode.addItem("Always keep folders first", "always")
@@ -514,6 +584,11 @@ class SettingsDialog(QDialog):
             card.add_row("Thumbnail mode", "Controls thumbnail generation.", self._thumbnail_mode),
             card.add_row("Max thumbnail size", "Skip thumbnails larger than this.", self._thumbnail_max_bytes),
             card.add_row("File size units", "Preferred size unit display.", self._size_units),
+            card.add_row(
+                "Folder size ignore",
+                "Comma-separated folder names skipped when totalling folder sizes.",
+                self._folder_size_ignore,
+            ),
             card.add_row("Date format", "Use 'locale' or an ISO-like format.", self._date_format),
             card.add_row("Folder sorting", "How folders sort relative to files.", self._folders_first_mode),
             card.add_row("", "", self._show_breadcrumbs),
@@ -910,6 +985,8 @@ class SettingsDialog(QDialog):
         self._status.setText("Applied.")
 
     def _apply(self) -> None:
+        for key in self._page_builders:
+            self._ensure_page_built(key)
         if self._ai_enabled.isChecked() and not self._config.get_bool("ai_disclosure_seen", False):
             dialog = AIDisclosureDialog(self._ai_provider.currentText(), self)
             if dialog.exec() != QDialog.Accepted:
@@ -936,6 +1013,10 @@ class SettingsDialog(QDialog):
         self._config.set("thumbnail_mode", self._thumbnail_mode.currentText())
         self._config.set("thumbnail_max_bytes", self._thumbnail_max_bytes.value() * 1024 * 1024)
         self._config.set("size_units", self._size_units.currentText())
+        self._config.set(
+            "folder_size_ignore",
+            [name.strip() for name in self._folder_size_ignore.text().split(",") if name.strip()],
+        )
         self._config.set("date_format", self._date_format.text().strip() or "locale")
         self._config.set("sort_folders_first", self._folders_first_mode.currentData())
         self._config.set("show_breadcrumbs", self._show_breadcrumbs.isChecked())
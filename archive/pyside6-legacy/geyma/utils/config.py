@@ -35,6 +35,10 @@ class ConfigStore:
         self._data = legacy_data
         self.save()
 
+    def reload(self) -> None:
+        self._data = {}
+        self._load()
+
     def get(self, key: str, default: Any = None) -> Any:
         return self._data.get(key, default)
 
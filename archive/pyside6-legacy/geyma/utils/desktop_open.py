@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import shutil
+from functools import lru_cache
+from typing import Iterator
+
+_KDE_OPEN = (("kioclient6", ("exec",)), ("kioclient5", ("exec",)), ("kde-open5", ()))
+_GIO_OPEN = (("gio", ("open",)),)
+_XDG_OPEN = (("xdg-open", ()),)
+_OPEN_ORDER = {
+    "kde": _KDE_OPEN + _GIO_OPEN + _XDG_OPEN,
+    "gio": _GIO_OPEN + _KDE_OPEN + _XDG_OPEN,
+    "xdg": _XDG_OPEN + _KDE_OPEN + _GIO_OPEN,
+}
+
+
+@lru_cache(maxsize=64)
+def _which(command: str) -> str | None:
+    return shutil.which(command)
+
+
+def open_commands(backend: str) -> Iterator[tuple[str, tuple[str, ...]]]:
+    """Yield installed (command, args) launchers, preferred backend first."""
+    for command, args in _OPEN_ORDER.get(backend, _OPEN_ORDER["kde"]):
+        if _which(command):
+            yield command, args
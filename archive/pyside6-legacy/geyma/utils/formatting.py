@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_UNIT_INDEX = {unit: index for index, unit in enumerate(_SIZE_UNITS)}
+
+
+@lru_cache(maxsize=1024)
+def format_size(value: int, preferred: str) -> str:
+    index = _SIZE_UNIT_INDEX.get(preferred)
+    if index is None:
+        # Each unit step is 10 bits, so the bit length picks the unit directly.
+        index = min(max(int(value).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if index == 0:
+        return f"{int(value)} B"
+    return f"{value / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
@@ -1,17 +1,84 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
-from typing import Iterable
+import threading
+from typing import Iterable, Iterator
 
 from geyma.utils.config import ConfigStore
 
 
+@lru_cache(maxsize=8192)
+def parse_timestamp(text: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(text.strip())
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def format_timestamp(text: str) -> str:
+    timestamp = parse_timestamp(text)
+    if timestamp is None:
+        return text.strip() or "Unknown"
+    return timestamp.strftime("%Y-%m-%d %H:%M")
+
+
+def _decode_entry(line: bytes) -> dict | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+class _ReverseSnapshot:
+    """Entries decoded newest-first so far for one version of the log file."""
+
+    def __init__(self, key: tuple[int, int], data: bytes) -> None:
+        self.key = key
+        self.entries: list[dict] = []
+        self.lock = threading.Lock()
+        # The raw bytes are captured up front so no file handle outlives the
+        # call that built the snapshot; only the JSON decoding is deferred.
+        self._data: bytes | None = data
+        self._end = len(data)
+
+    def get(self, index: int) -> dict | None:
+        with self.lock:
+            while index >= len(self.entries):
+                entry = self._next_entry()
+                if entry is None:
+                    return None
+                self.entries.append(entry)
+            return self.entries[index]
+
+    def _next_entry(self) -> dict | None:
+        data = self._data
+        if data is None:
+            return None
+        while self._end >= 0:
+            start = data.rfind(b"\n", 0, self._end) + 1
+            line = data[start : self._end]
+            self._end = start - 1
+            entry = _decode_entry(line)
+            if entry is not None:
+                return entry
+        self._data = None
+        return None
+
+
 class OperationLog:
     def __init__(self, config: ConfigStore | None = None) -> None:
         self._config = config or ConfigStore()
         self._log_path = self._resolve_log_path()
+        self._snapshot: _ReverseSnapshot | None = None
+        self._snapshot_lock = threading.Lock()
 
     def append(
         self,
@@ -54,6 +121,42 @@ class OperationLog:
             return entries[-limit:]
         return entries
 
+    def iter_entries_reversed(self) -> Iterator[dict]:
+        # Readers share one lazily decoded snapshot until the file changes,
+        # so back-to-back scans only decode the entries they actually reach.
+        snapshot = self._current_snapshot()
+        if snapshot is None:
+            return
+        index = 0
+        while True:
+            entry = snapshot.get(index)
+            if entry is None:
+                return
+            yield entry
+            index += 1
+
+    def _current_snapshot(self) -> _ReverseSnapshot | None:
+        try:
+            stat_result = self._log_path.stat()
+        except OSError:
+            return None
+        key = (stat_result.st_size, stat_result.st_mtime_ns)
+        with self._snapshot_lock:
+            if self._snapshot is None or self._snapshot.key != key:
+                self._snapshot = self._read_snapshot()
+            return self._snapshot
+
+    def _read_snapshot(self) -> _ReverseSnapshot | None:
+        try:
+            with self._log_path.open("rb") as handle:
+                data = handle.read()
+                # Key on the handle we actually read, so a rewrite between the
+                # path stat and the open can't be cached under the old key.
+                stat_result = os.fstat(handle.fileno())
+        except OSError:
+            return None
+        return _ReverseSnapshot((stat_result.st_size, stat_result.st_mtime_ns), data)
+
     def clear(self) -> None:
         if self._log_path.exists():
             self._log_path.unlink()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -52,6 +53,8 @@ class WorkingSet:
 class WorkingSetStore:
     def __init__(self, config: ConfigStore | None = None) -> None:
         self._config = config or ConfigStore()
+        self._path_index_source: object = None
+        self._path_index: dict[str, list[int]] = {}
 
     def list_sets(self) -> list[WorkingSet]:
         raw_sets = list(self._config.get("working_sets", []))
@@ -78,6 +81,12 @@ class WorkingSetStore:
             )
         return sets
 
+    def set_names(self) -> list[tuple[str, str]]:
+        return [
+            (entry.get("id", ""), entry.get("name", "Untitled"))
+            for entry in self._config.get("working_sets", [])
+        ]
+
     def create_set(self, name: str, description: str = "") -> WorkingSet:
         new_set = WorkingSet(id=str(uuid4()), name=name, description=description)
         sets = self.list_sets()
@@ -103,6 +112,30 @@ class WorkingSetStore:
                 return item
         return None
 
+    def sets_for_paths(self, paths: list[str]) -> list[tuple[str, str]]:
+        raw_sets = self._config.get("working_sets", [])
+        if raw_sets is not self._path_index_source:
+            self._rebuild_path_index(raw_sets)
+        positions: set[int] = set()
+        for path in paths:
+            if path:
+                positions.update(self._path_index.get(os.path.normpath(path), ()))
+        return [
+            (raw_sets[pos].get("id", ""), raw_sets[pos].get("name", "Untitled"))
+            for pos in sorted(positions)
+        ]
+
+    def _rebuild_path_index(self, raw_sets: list[dict]) -> None:
+        index: dict[str, list[int]] = {}
+        for pos, entry in enumerate(raw_sets):
+            for item in entry.get("items", []):
+                key = os.path.normpath(item.get("path", ""))
+                positions = index.setdefault(key, [])
+                if not positions or positions[-1] != pos:
+                    positions.append(pos)
+        self._path_index = index
+        self._path_index_source = raw_sets
+
     def add_items(self, set_id: str, paths: list[str]) -> None:
         sets = self.list_sets()
         for work_set in sets: